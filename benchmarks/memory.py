@@ -0,0 +1,77 @@
+"""
+Memory per drawn element, measured with tracemalloc for a single G holding n elements.
+'built' counts the tree after construction, 'rendered' additionally the output cached by construct(cache=True).
+
+    python benchmarks/memory.py                      # the source tree of this checkout
+    python benchmarks/memory.py old/src new/src      # side by side, e.g. with `git worktree add old <rev>`
+
+Every source tree is measured in its own interpreter, so that the versions do not share imported modules.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+N = 50000
+
+MEASURE = '''
+import json, sys, tracemalloc
+sys.path.insert(0, sys.argv[1])
+from PSVG import G, Circle, Rect, Path, Text, Font
+
+n = int(sys.argv[2])
+font = Font('Arial', '400')
+
+try:
+    from PSVG.Render import RenderOptions
+    options = (RenderOptions(cache=True),)
+except ImportError:
+    # source trees from before RenderOptions always cache (or never do)
+    options = ()
+
+
+def per_element(make, render):
+    tracemalloc.start()
+    g = G()
+    for i in range(n):
+        g.add_child(make(i))
+    if render:
+        g.construct(0, *options)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / n
+
+
+makers = {
+    'Circle': lambda i: Circle(i, i, 2),
+    'Rect': lambda i: Rect(i, i, 3, 4, fill=(1, 2, 3)),
+    'Path': lambda i: Path([('M', 0, 0), ('L', i, i)]),
+    'Text': lambda i: Text(font, 't', x=i),
+}
+print(json.dumps({name: (per_element(make, False), per_element(make, True)) for name, make in makers.items()}))
+'''
+
+
+def measure(src: str, n: int = N) -> dict:
+    """
+    :param src: directory containing the PSVG package
+    :param n: number of elements per measurement
+    :return: (built, rendered) bytes per element for every element type
+    """
+    import json
+
+    out = subprocess.run([sys.executable, '-c', MEASURE, src, str(n)], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout)
+
+
+def main(sources):
+    sources = sources or [str(Path(__file__).resolve().parents[1] / 'src')]
+    results = [measure(src) for src in sources]
+
+    print(f'bytes per element, {N} elements in one G (built / rendered)')
+    print(f'{"":8}' + ''.join(f'{src[-30:]:>34}' for src in sources))
+    for name in results[0]:
+        print(f'{name:8}' + ''.join(f'{"%.0f / %.0f" % tuple(result[name]):>34}' for result in results))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
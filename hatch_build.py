@@ -0,0 +1,21 @@
+"""
+Build hook compiling the metrics file of every font (see PSVG.Text.Font.compile_all) into the wheel,
+so that installed fonts are memory mapped instead of parsed with fontTools on first use.
+"""
+import importlib.util
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class MetricsBuildHook(BuildHookInterface):
+    def initialize(self, version, build_data):
+        # Font.py only depends on the standard library, numpy and fontTools, it is loaded on its own
+        # instead of importing the package before it is built
+        path = Path(self.root) / 'src' / 'PSVG' / 'Text' / 'Font.py'
+        spec = importlib.util.spec_from_file_location('_psvg_font', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        for metrics in module.Font.compile_all():
+            build_data['artifacts'].append(metrics.relative_to(self.root).as_posix())
@@ -1,5 +1,41 @@
+from operator import attrgetter
+from types import MappingProxyType
+
+# shared child container of every node without children, replaced by a real dict on the first add_child
+_NO_EDGES = MappingProxyType({})
+
+
+def _restore(cls, values, edges, extra):
+    """
+    Unpickles a node, see Node.__reduce__
+    """
+    node = cls.__new__(cls)
+    setattr_ = object.__setattr__
+    for slot, value in zip(cls._pickled_slots(), values):
+        setattr_(node, slot, value)
+
+    if extra:
+        node.__dict__.update(extra)
+
+    setattr_(node, '_cache', None)
+    setattr_(node, '_ins', ())
+    setattr_(node, '_shared', False)
+    if edges:
+        children = {}
+        for child, weight in edges:
+            children[child] = Edge(node, child, weight)
+            setattr_(child, '_ins', child._ins + (node,))
+        setattr_(node, '_edges', children)
+    else:
+        setattr_(node, '_edges', _NO_EDGES)
+
+    return node
+
+
 class Edge:
     # todo: add documentation
+    __slots__ = ('beg', 'end', 'weight')
+
     def __init__(self, a_node, z_node, weight=None):
         self.beg = a_node
         self.end = z_node
@@ -8,23 +44,153 @@ class Edge:
 
 class Node:
     # todo: add documentation
+
+    # Nodes are slotted to keep large trees compact, subclasses list their own attributes in __slots__.
+    # Nodes have no __dict__, so attributes that are not declared can not be assigned (g.foo = 1 raises an
+    # AttributeError). Subclasses that need to hold arbitrary attributes add '__dict__' to their __slots__.
+    # Leaves share one empty, read-only edges mapping and keep their parents in a tuple.
+    # A node created by share() borrows the edges of its source (_shared) until they are accessed through edges.
+    __slots__ = ('name', 'value', 'visited', 'depth', '_edges', '_shared', '_ins', '_cache')
+
+    # names of all slots and of the pickled slots per node class, see share and __reduce__
+    _all_slots = {}
+    _all_pickled = {}
+
+    # getter of the attributes that make up the rendered svg definition per node class, see _state
+    _all_states = {}
+
     def __init__(self, name, value=None):
+        self._cache = None
+        self._ins = ()
+        self._shared = False
+        self._edges = _NO_EDGES
         self.name = name
         self.value = value
         self.visited = False
         self.depth = 0
-        self.edges = {}
-        self._ins = set()
+
+    @property
+    def edges(self):
+        self._own()
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges):
+        self._edges = edges
+        self._shared = False
 
     def add_child(self, node: 'Node', weight=None):
+        self._own()
+        if self._edges is _NO_EDGES:
+            self._edges = {}
+
         edge = Edge(self, node, weight)
-        self.edges[node] = edge
-        node._ins.add(self)
+        self._edges[node] = edge
+        if self not in node._ins:
+            node._ins += (self,)
 
     def add_parent(self, node: 'Node', weight=None):
-        edge = Edge(node, self, weight)
-        node.edges[self] = edge
-        self._ins.add(edge)
+        node.add_child(self, weight)
+
+    @classmethod
+    def _slot_names(cls) -> list[str]:
+        slots = Node._all_slots.get(cls)
+        if slots is None:
+            slots = [i for c in cls.__mro__ for i in getattr(c, '__slots__', ()) if i != '__dict__']
+            Node._all_slots[cls] = slots
+
+        return slots
+
+    def __reduce__(self):
+        """
+        Pickles the subtree below this node, e.g. to render it in another process.
+        Parents and cached output are left out, the children are stored with the weights of their edges.
+        """
+        cls = type(self)
+        values = tuple([getattr(self, slot, None) for slot in cls._pickled_slots()])
+        edges = () if self._edges is _NO_EDGES else tuple([(node, edge.weight) for node, edge in self._edges.items()])
+        return _restore, (cls, values, edges, getattr(self, '__dict__', None))
+
+    @classmethod
+    def _pickled_slots(cls) -> list[str]:
+        slots = Node._all_pickled.get(cls)
+        if slots is None:
+            slots = [i for i in cls._slot_names() if i not in ('_ins', '_cache', '_edges', '_shared')]
+            Node._all_pickled[cls] = slots
+
+        return slots
+
+    def share(self) -> 'Node':
+        """
+        Creates a copy of this node in O(1) that shares its whole subtree with this node (copy on write).
+        The children of the copy are only cloned, one level at a time, when they are reached through its edges,
+        so that a change made through the copy never reaches this node and only the changed path is ever cloned.
+        Rendered output cached on this node is reused by the copy until the copy changes.
+
+        The subtree of this node is read by all of its copies and has to be treated as read-only afterwards.
+
+        :return: node of the same class with the same attributes
+        """
+        cls = type(self)
+        node = cls.__new__(cls)
+        for slot in cls._slot_names():
+            try:
+                object.__setattr__(node, slot, getattr(self, slot))
+            except AttributeError:
+                pass
+
+        if hasattr(self, '__dict__'):
+            node.__dict__.update(self.__dict__)
+
+        node._ins = ()
+        node._shared = node._edges is not _NO_EDGES
+        return node
+
+    def _own(self):
+        """
+        Replaces borrowed edges (see share) with edges to copies of the children
+        """
+        if not self._shared:
+            return
+
+        edges = {}
+        for node, edge in self._edges.items():
+            child = node.share()
+            child._ins = (self,)
+            edges[child] = Edge(self, child, edge.weight)
+
+        self._edges = edges
+        self._shared = False
+
+    def _state(self) -> tuple:
+        """
+        :return: the attributes of this node (everything but the Node bookkeeping), compared by identity to tell
+        whether cached output is still valid
+        """
+        cls = type(self)
+        getter = Node._all_states.get(cls)
+        if getter is None:
+            slots = [i for i in cls._slot_names() if i not in Node.__slots__]
+            if len(slots) > 1:
+                getter = attrgetter(*slots)
+            else:
+                # attrgetter only returns a tuple for several names
+                def getter(node, slots=tuple(slots)):
+                    return tuple([getattr(node, slot) for slot in slots])
+            Node._all_states[cls] = getter
+
+        try:
+            return getter(self)
+        except AttributeError:
+            return tuple([getattr(self, slot, None) for slot in cls._slot_names() if slot not in Node.__slots__])
+
+    def touch(self):
+        """
+        Drops the cached svg definition of this node so that it is rebuilt on the next construct.
+        Assigning an attribute is detected automatically, in place changes (e.g. appending to Path.points or
+        writing into the arrays of a Batch) need to call this explicitly.
+        """
+        self._cache = None
 
     @property
     def in_deg(self):
@@ -32,7 +198,7 @@ class Node:
 
     @property
     def out_deg(self):
-        return len(self.edges)
+        return len(self._edges)
 
 
 class Graph:
@@ -48,7 +214,7 @@ class Graph:
 
     def _refresh(self):
         for node in self.nodes:
-            node._visited = False
+            node.visited = False
 
     def print(self):
         self._refresh()
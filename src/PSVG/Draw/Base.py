@@ -1,4 +1,6 @@
 from ..Data_Structures import Node
+from operator import is_
+from ..Render import RenderOptions, DEFAULT, Slot
 
 
 # noinspection PyBroadException
@@ -19,6 +21,12 @@ class Base(Node):
     Any parameter not set will be absent from the svg definition.
     """
 
+    __slots__ = ('type', 'fill', 'fill_opacity', 'stroke', 'stroke_width', 'stroke_opacity', 'stroke_dasharray',
+                 'active')
+
+    # keys of _validate holding the presentation attributes that can be shared through a css class
+    _style_keys = ('fill', 'fill opacity', 'stroke', 'stroke width', 'stroke opacity', 'stroke dasharray')
+
     def __init__(self, name, fill=None, fill_opacity=None, stroke=None, stroke_width=None, stroke_opacity=None,
                  stroke_dasharray=None, active=True):
         super().__init__(name)
@@ -32,13 +40,10 @@ class Base(Node):
         self.stroke_opacity = stroke_opacity
         self.stroke_dasharray = stroke_dasharray
 
-        self.valid = {}
-
         self.active = active
 
     def __str__(self):
-        self._validate()
-        s = ' '.join([i for i in self.valid.values() if i is not None])
+        s = ' '.join([i for i in self._validate().values() if i is not None])
         return f'<{self.type} {s}/>'
 
     @staticmethod
@@ -48,6 +53,9 @@ class Base(Node):
         :param color: (r, g, b) tuple that defines the color
         :return: hex color string
         """
+        if isinstance(color, Slot):
+            return color
+
         try:
             red, green, blue = [f'{i:0{2}x}' for i in color]
             return f'#{red}{green}{blue}'
@@ -55,39 +63,46 @@ class Base(Node):
             return None
 
     @staticmethod
-    def _get_string_value(val, var):
+    def _get_string_value(val, var, options: RenderOptions = DEFAULT):
         """
         returns the appropriate value for the given svg attribute
         :param val: value of the svg attribute
         :param var: name of the svg attribute
+        :param options: output settings used to format numbers
         :return: formatted attribute string
         """
         try:
             if val is not None:
-                val = str(val)
+                val = options.num(val)
                 return f'{var}="{val}"'
         except:
             return None
 
-    def _validate(self):
+    def _validate(self, options: RenderOptions = DEFAULT):
         """
         Validates each svg attribute
+
+        :param options: output settings used to format numbers
+        :return: dictionary of the formatted svg attributes, None where an attribute is omitted
         """
+        valid = {}
+
         # Fill #########################################################################################################
         if self.fill is not None:
             color = self._color2hex(self.fill)
             if color is not None:
-                self.valid['fill'] = f'fill="{color}"'
+                valid['fill'] = f'fill="{color}"'
 
         # Fill Opacity #################################################################################################
         val = self.fill_opacity
         try:
-            if val < 0:
-                val = 0
-            if val > 1:
-                val = 1
+            if not isinstance(val, Slot):
+                if val < 0:
+                    val = 0
+                if val > 1:
+                    val = 1
 
-            self.valid['fill opacity'] = f'fill-opacity="{val}"'
+            valid['fill opacity'] = f'fill-opacity="{options.num(val)}"'
         except:
             pass
 
@@ -95,24 +110,25 @@ class Base(Node):
         if self.stroke is not None:
             color = self._color2hex(self.stroke)
             if color is not None:
-                self.valid['stroke'] = f'stroke="{color}"'
+                valid['stroke'] = f'stroke="{color}"'
 
         # Stroke Width #################################################################################################
         if self.stroke_width is not None:
             try:
-                self.valid['stroke width'] = f'stroke-width="{self.stroke_width}"'
+                valid['stroke width'] = f'stroke-width="{options.num(self.stroke_width)}"'
             except:
                 pass
 
         # Stroke Opacity ###############################################################################################
         val = self.stroke_opacity
         try:
-            if val < 0:
-                val = 0
-            if val > 1:
-                val = 1
+            if not isinstance(val, Slot):
+                if val < 0:
+                    val = 0
+                if val > 1:
+                    val = 1
 
-            self.valid['stroke opacity'] = f'stroke-opacity="{val}"'
+            valid['stroke opacity'] = f'stroke-opacity="{options.num(val)}"'
         except:
             pass
 
@@ -120,23 +136,97 @@ class Base(Node):
         val = self.stroke_dasharray
         if val is not None:
             try:
-                dashes = ' '.join([str(i) for i in val])
-                self.valid['stroke dasharray'] = f'stroke-dasharray="{dashes}"'
+                dashes = val if isinstance(val, Slot) else ' '.join([options.num(i) for i in val])
+                valid['stroke dasharray'] = f'stroke-dasharray="{dashes}"'
             except:
                 pass
 
-    def construct(self, depth):
+        return valid
+
+    @property
+    def valid(self):
+        return self._validate()
+
+    def _style(self, options: RenderOptions = DEFAULT) -> tuple:
+        """
+        :return: the formatted presentation attributes of this object, see `RenderOptions.classes`
+        """
+        valid = self._validate(options)
+        return tuple([valid[key] for key in self._style_keys if valid.get(key) is not None])
+
+    def _attributes(self, options: RenderOptions = DEFAULT) -> dict:
+        """
+        Validated svg attributes of this object,
+        with the presentation attributes replaced by a class attribute when options share styles through css classes
+
+        :param options: output settings
+        :return: dictionary of the formatted svg attributes, None where an attribute is omitted
+        """
+        valid = self._validate(options)
+        if options.styles is None:
+            return valid
+
+        style = tuple([valid.pop(key) for key in self._style_keys if valid.get(key) is not None])
+        if not style:
+            return valid
+
+        return {'class': f'class="{options.styles[style]}"', **valid}
+
+    def construct(self, depth, options: RenderOptions = DEFAULT):
         """
         Constructs the svg definition
         :param depth: current depth of this node in the svg tree
+        :param options: output settings (minification, numeric precision)
         :return: String containing the svg definition for this object
         """
         if self.active is False:
             return ''
 
-        self._validate()
-        s = ' '.join([i for i in self.valid.values() if i is not None])
-        return f'{"   " * depth}<{self.type} {s}/>'
+        return f'{options.tab(depth)}{self._rendered(options)}'
+
+    def _rendered(self, options: RenderOptions):
+        """
+        :return: the output of _render for options, cached on the node until one of its attributes changes.
+        The cache is only used with options.cache, in place changes made since are only seen after touch()
+        """
+        if not options.cache:
+            return self._render(options)
+
+        cache = self._cache
+        state = None
+        if cache is not None and cache[0] == options.key:
+            # the attributes are compared by identity, any assignment since the output was cached invalidates it
+            state = self._state()
+            if all(map(is_, cache[1], state)):
+                return cache[2]
+
+        rendered = self._render(options)
+        self._cache = (options.key, self._state() if state is None else state, rendered)
+
+        return rendered
+
+    def _render(self, options: RenderOptions = DEFAULT):
+        """
+        Builds the svg definition of this object without indentation.
+
+        :param options: output settings used to format numbers
+        :return: String containing the svg element
+        """
+        s = ' '.join([i for i in self._attributes(options).values() if i is not None])
+        return f'<{self.type} {s}/>'
+
+    def iter_construct(self, depth, options: RenderOptions = DEFAULT):
+        """
+        Lazily constructs the svg definition
+
+        :param depth: current depth of this node in the svg tree
+        :param options: output settings (minification, numeric precision)
+        :return: generator yielding the svg definition for this object
+        """
+        if self.active is False:
+            return
+
+        yield self.construct(depth, options)
 
     def copy(self, item: 'Base' = None):
         """
@@ -0,0 +1,214 @@
+import numpy as np
+
+from .Base import Base
+from ..Render import RenderOptions, DEFAULT
+
+
+def _strings(values, count, options: RenderOptions):
+    """
+    Formats a scalar or an array of values the way `Base._get_string_value` formats a single value
+
+    :param values: scalar or array like with one value per element
+    :param count: number of elements in the batch
+    :param options: output settings used to format numbers
+    :return: list of count strings
+    """
+    array = np.asarray(values)
+    strings = options.nums(np.broadcast_to(array, (count,)))
+
+    # numpy turns the ints of a python sequence mixing ints and floats into floats, Base writes them as ints
+    if array.dtype.kind == 'f' and array.ndim == 1 and not isinstance(values, np.ndarray):
+        ints = np.fromiter((isinstance(i, (int, np.integer)) and not isinstance(i, bool) for i in values),
+                           dtype=bool, count=len(array))
+        if ints.any():
+            index = np.broadcast_to(np.arange(len(array)), (count,))
+            for i in np.flatnonzero(ints[index]).tolist():
+                strings[i] = str(values[index[i]])
+
+    return strings
+
+
+def _colors2hex(colors, count):
+    """
+    Vectorized version of `Base._color2hex`
+
+    :param colors: (count, 3) array like of (r, g, b) values
+    :param count: number of elements in the batch
+    :return: list of count hex color strings
+    """
+    rgb = np.broadcast_to(np.asarray(colors, dtype=np.int64), (count, 3))
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    return ['#%06x' % i for i in packed.tolist()]
+
+
+class Batch(Base):
+    """
+    Abstract Class
+
+    Draws many elements of one type from arrays, as a single node of the svg tree.
+    All elements are formatted in one pass over the arrays instead of one object per element.
+
+    The parameters of `Draw.Base` apply to every element of the batch.
+    fills can additionally give every element its own fill color as an (n, 3) array of (r, g, b) values.
+
+    Modifying the arrays in place requires a call to touch() before the next construct.
+    """
+    __slots__ = ('fills',)
+
+    # (attribute, svg attribute) pairs formatted per element, None valued optional columns are skipped
+    _columns = ()
+
+    def __init__(self, name, fills=None, **kwargs):
+        super().__init__(name, **kwargs)
+        self.fills = fills
+
+    @property
+    def count(self):
+        """
+        :return: number of elements in the batch
+        """
+        shapes = [np.shape(getattr(self, attr)) for attr, _ in self._columns if getattr(self, attr) is not None]
+        if self.fills is not None:
+            shapes.append(np.shape(self.fills)[:-1])
+
+        shape = np.broadcast_shapes(*shapes)
+        return shape[0] if shape else 1
+
+    def _render(self, options: RenderOptions = DEFAULT):
+        """
+        Builds the svg definition of every element in the batch without indentation
+
+        :param options: output settings used to format numbers
+        :return: list with one element string per item
+        """
+        count = self.count
+
+        valid = self._attributes(options)
+        columns = [_strings(getattr(self, attr), count, options)
+                   for attr, _ in self._columns if getattr(self, attr) is not None]
+        names = [f'{var}="%s"' for attr, var in self._columns if getattr(self, attr) is not None]
+
+        if self.fills is not None:
+            # per element fill colors take the place of the shared fill attribute
+            valid = {'fill': 'fill="%s"', **valid}
+            columns.insert(0, _colors2hex(self.fills, count))
+
+        fixed = [i if key == 'fill' else i.replace('%', '%%') for key, i in valid.items() if i is not None]
+        template = self._template(' '.join(fixed + names))
+        columns += self._contents(count)
+
+        return [template % row for row in zip(*columns)]
+
+    def _template(self, attributes: str) -> str:
+        """
+        :param attributes: formatted attributes of an element, with a %s placeholder per column
+        :return: format string of a single element
+        """
+        return f'<{self.type} {attributes}/>'
+
+    def _contents(self, count) -> list:
+        """
+        :return: columns filling the placeholders _template adds after the attributes
+        """
+        return []
+
+    def _validate(self, options: RenderOptions = DEFAULT):
+        valid = super()._validate(options)
+        if self.fills is not None:
+            valid.pop('fill', None)
+
+        return valid
+
+    def construct(self, depth, options: RenderOptions = DEFAULT):
+        if self.active is False:
+            return ''
+
+        tab = options.tab(depth)
+        return options.newline.join([f'{tab}{i}' for i in self._rendered(options)])
+
+    def iter_construct(self, depth, options: RenderOptions = DEFAULT, chunk=4096):
+        """
+        Lazily constructs the svg definition of the batch, chunk elements per fragment
+
+        :param depth: current depth of this node in the svg tree
+        :param options: output settings (minification, numeric precision)
+        :param chunk: number of elements joined into each yielded fragment
+        """
+        if self.active is False:
+            return
+
+        tab = options.tab(depth)
+        lines = self._rendered(options)
+        for start in range(0, len(lines), chunk):
+            yield options.newline.join([f'{tab}{i}' for i in lines[start:start + chunk]])
+
+    def copy(self, item: 'Batch' = None):
+        item = super().copy(item)
+        item.fills = self.fills
+
+        for attr, _ in self._columns:
+            setattr(item, attr, getattr(self, attr))
+
+        return item
+
+
+class CircleBatch(Batch):
+    """
+    Concrete Implementation of `Draw.Batch`
+
+    Draws one circle element per entry of cx, cy and r, which are broadcast against each other.
+    """
+    __slots__ = ('cx', 'cy', 'r')
+
+    _columns = (('cx', 'cx'), ('cy', 'cy'), ('r', 'r'))
+
+    def __init__(self, cx=0, cy=0, r=1, **kwargs):
+        """
+        :param cx: x coordinates of the circle centers
+        :param cy: y coordinates of the circle centers
+        :param r: radii of the circles
+        :param fills: optional (n, 3) array of (r, g, b) fill colors, one per circle
+        """
+        super().__init__(name='circle batch', **kwargs)
+        self.type = 'circle'
+
+        self.cx = cx
+        self.cy = cy
+        self.r = r
+
+    def copy(self, item: 'CircleBatch' = None):
+        return super().copy(CircleBatch() if item is None else item)
+
+
+class RectBatch(Batch):
+    """
+    Concrete Implementation of `Draw.Batch`
+
+    Draws one rect element per entry of x, y, w and h, which are broadcast against each other.
+    """
+    __slots__ = ('x', 'y', 'w', 'h', 'rx', 'ry')
+
+    _columns = (('x', 'x'), ('y', 'y'), ('w', 'width'), ('h', 'height'), ('rx', 'rx'), ('ry', 'ry'))
+
+    def __init__(self, x=0, y=0, w=0, h=0, rx=None, ry=None, **kwargs):
+        """
+        :param x: x coordinates of the rectangles
+        :param y: y coordinates of the rectangles
+        :param w: widths of the rectangles
+        :param h: heights of the rectangles
+        :param rx: optional horizontal rounding of the rectangle edges
+        :param ry: optional vertical rounding of the rectangle edges
+        :param fills: optional (n, 3) array of (r, g, b) fill colors, one per rectangle
+        """
+        super().__init__(name='rect batch', **kwargs)
+        self.type = 'rect'
+
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.rx = rx
+        self.ry = ry
+
+    def copy(self, item: 'RectBatch' = None):
+        return super().copy(RectBatch() if item is None else item)
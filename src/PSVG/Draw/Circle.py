@@ -1,7 +1,10 @@
 from .Base import Base
+from ..Render import DEFAULT
 
 
 class Circle(Base):
+    __slots__ = ('cx', 'cy', 'r')
+
     def __init__(self, cx=0, cy=0, r=0, **kwargs):
         """
         Concrete Implementation of `Draw.Base`
@@ -22,18 +25,20 @@ class Circle(Base):
 
         self.type = 'circle'
 
-    def _validate(self):
-        super(Circle, self)._validate()
+    def _validate(self, options=DEFAULT):
+        valid = super(Circle, self)._validate(options)
         s = super(Circle, self)._get_string_value
 
         # cx ###########################################################################################################
-        self.valid['cx'] = s(self.cx, 'cx')
+        valid['cx'] = s(self.cx, 'cx', options)
 
         # cy ###########################################################################################################
-        self.valid['cy'] = s(self.cy, 'cy')
+        valid['cy'] = s(self.cy, 'cy', options)
 
         # r ############################################################################################################
-        self.valid['r'] = s(self.r, 'r')
+        valid['r'] = s(self.r, 'r', options)
+
+        return valid
 
     def copy(self, item: 'Circle' = None):
         item = super().copy(Circle()) if item is None else super().copy(item)
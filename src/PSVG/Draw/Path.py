@@ -1,4 +1,119 @@
+import numpy as np
+
 from .Base import Base
+from ..Render import RenderOptions, DEFAULT
+from .Simplify import douglas_peucker, visvalingam, minmax_decimate
+
+# number of coordinates consumed by each path command
+_ARGS = {'M': 2, 'L': 2, 'T': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'A': 7, 'Z': 0}
+
+# lookup tables indexed by the ascii code of a command:
+# _COUNTS holds the number of coordinates (-1 for unknown commands),
+# _AXES whether each coordinate of the command is an x (0) or a y (1) value, or neither (-1)
+_COUNTS = np.full(128, -1, dtype=np.intp)
+_AXES = np.full((128, 7), -1, dtype=np.int8)
+for _cmd, _n in _ARGS.items():
+    _axes = {'H': [0], 'V': [1], 'A': [-1] * 5 + [0, 1]}.get(_cmd, [0, 1] * (_n // 2))
+    for _code in (ord(_cmd), ord(_cmd.lower())):
+        _COUNTS[_code] = _n
+        _AXES[_code, :_n] = _axes
+
+
+def _previous(values, start=0.0):
+    """
+    Shifts values one step forward (the first entry becoming start) and fills every nan with the last value
+    before it, i.e. for the end points of a sequence of commands returns the current point before each command.
+    """
+    values = np.concatenate(([start], values[:-1]))
+    idx = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(idx, out=idx)
+    return values[idx]
+
+
+def _path_data(commands: str, coords: np.ndarray, relative=False, elide=True,
+               options: RenderOptions = DEFAULT) -> str:
+    """
+    Formats path commands and their coordinates into the d attribute of a path element in one vectorized pass
+
+    :param commands: one letter per path command, e.g. 'MLLLZ'
+    :param coords: flat array holding the coordinates of all commands in order
+    :param relative: re-encode absolute commands as relative ones (lower case letters)
+    :param elide: drop command letters that svg implies (repeated commands and lines following a move)
+    :param options: output settings used to format the coordinates
+    :return: path data string
+    """
+    codes = np.frombuffer(commands.encode('ascii'), dtype=np.uint8)
+    if codes.size and codes.max() >= 128 or (codes.size and (_COUNTS[codes] < 0).any()):
+        raise ValueError(f'unsupported path command in {commands!r}')
+
+    counts = _COUNTS[codes]
+    starts = np.cumsum(counts) - counts
+    if counts.sum() != coords.size:
+        raise ValueError(f'path commands expect {counts.sum()} coordinates, got {coords.size}')
+
+    letters = np.array(list(commands), dtype=object)
+
+    if relative:
+        if any(c.islower() for c in set(commands)):
+            raise ValueError('relative encoding needs absolute (upper case) path commands')
+
+        # rounding every step on its own would accumulate the error along the path,
+        # so the absolute coordinates are rounded and the steps taken between the rounded points
+        if options.precision is not None and coords.dtype.kind == 'f':
+            coords = coords.round(options.precision)
+
+        # end point of every command
+        n = len(codes)
+        xs, ys = np.full(n, np.nan), np.full(n, np.nan)
+        pairs = counts >= 2
+        xs[pairs] = coords[starts[pairs] + counts[pairs] - 2]
+        ys[pairs] = coords[starts[pairs] + counts[pairs] - 1]
+        xs[codes == ord('H')] = coords[starts[codes == ord('H')]]
+        ys[codes == ord('V')] = coords[starts[codes == ord('V')]]
+
+        # closing a path returns to the point of the last move
+        moves = np.where(codes == ord('M'), np.arange(n), 0)
+        np.maximum.accumulate(moves, out=moves)
+        close = codes == ord('Z')
+        xs[close], ys[close] = xs[moves[close]], ys[moves[close]]
+
+        # current point before every command
+        xs, ys = _previous(xs), _previous(ys)
+
+        owner = np.repeat(np.arange(n), counts)
+        axes = _AXES[codes[owner], np.arange(coords.size) - starts[owner]]
+        offsets = np.where(axes == 0, xs[owner], np.where(axes == 1, ys[owner], 0))
+        coords = coords - offsets.astype(coords.dtype, copy=False)
+        if coords.dtype.kind == 'f':
+            coords = coords.round(10)
+
+        letters = np.array([c.lower() for c in letters], dtype=object)
+
+    # letters svg would imply anyway
+    shown = np.ones(len(codes), dtype=bool)
+    if elide and len(codes) > 1:
+        prev, curr = codes[:-1], codes[1:]
+
+        # coordinates repeating a move are read as lines, so only the letters of other commands are implied
+        moves = (curr == ord('M')) | (curr == ord('m'))
+        shown[1:] = ~(((curr == prev) & ~moves) | (((prev == ord('M')) & (curr == ord('L'))) |
+                                                   ((prev == ord('m')) & (curr == ord('l')))))
+        shown |= counts == 0
+
+    prefixes = np.full(coords.size, ' ', dtype=object)
+    has_args = counts > 0
+    prefixes[starts[has_args]] = np.where(shown, letters, ' ')[has_args]
+
+    # commands without coordinates are glued in front of the next command
+    trailing = ''
+    for i in np.flatnonzero(~has_args)[::-1]:
+        if starts[i] < coords.size:
+            prefixes[starts[i]] = letters[i] + prefixes[starts[i]]
+        else:
+            trailing = letters[i] + trailing
+
+    numbers = options.nums(coords)
+    return ''.join([p + s for p, s in zip(prefixes.tolist(), numbers)]) + trailing
 
 
 class Path(Base):
@@ -9,9 +124,14 @@ class Path(Base):
 
     Path elements are used to draw curves and shapes
     freely based on defined curve behavior and coordinates on which to draw.
+
+    The path can either be given as a list of points or, for long paths, as a string of commands
+    and a coordinate array which is formatted in a single vectorized pass.
     """
 
-    def __init__(self, points=None, **kwargs):
+    __slots__ = ('points', 'commands', 'coords', 'relative', 'elide')
+
+    def __init__(self, points=None, commands=None, coords=None, relative=False, elide=True, **kwargs):
         """
         :param points: a tuple of the form (command, x, y) where command is one of the following:
         'M': move to the point (x, y)
@@ -19,25 +139,106 @@ class Path(Base):
         'V': draw a vertical line from the current location to (y)
         'H': draw a horizontal line from the current location to (x)
         'C': use the following points to draw a Cubic Bézier Curve
+        :param commands: alternative to points, one command letter per path command, e.g. 'MLLLZ'
+        :param coords: array with the coordinates of all commands in order, flat or one row per command point
+        :param relative: encode the commands relative to the previous point, which shortens paths with large
+        coordinates and small steps
+        :param elide: leave out command letters that are implied by the previous command
 
         see `Paths Documentation <https://developer.mozilla.org/en-US/docs/Web/SVG/Tutorial/Paths>`_
         for details on what path operations are supported
         """
         super().__init__(name='path', **kwargs)
         self.points = [] if points is None else points
+        self.commands = None if commands is None else ''.join(commands)
+        self.coords = None if coords is None else np.asarray(coords).ravel()
+        self.relative = relative
+        self.elide = elide
         self.type = 'path'
 
-    def _validate(self):
-        super(Path, self)._validate()
+    @classmethod
+    def polyline(cls, x, y, closed=False, **kwargs) -> 'Path':
+        """
+        Creates a path through the points (x[i], y[i]), e.g. a time series
+
+        :param x: array of x coordinates
+        :param y: array of y coordinates
+        :param closed: connect the last point back to the first one
+        :return: array backed Path
+        """
+        x, y = np.asarray(x), np.asarray(y)
+        commands = ('M' + 'L' * (len(x) - 1) if len(x) else '') + ('Z' if closed else '')
+        return cls(commands=commands, coords=np.column_stack((x, y)), **kwargs)
+
+    def _polyline(self):
+        """
+        :return: (n, 2) array of the points of an array backed polyline and whether it is closed
+        """
+        commands = '' if self.commands is None else self.commands
+        closed = commands.endswith('Z')
+        if commands.rstrip('Z') != 'M' + 'L' * (len(commands.rstrip('Z')) - 1) or commands.count('Z') > 1:
+            raise ValueError('simplification needs an array backed polyline, i.e. commands of the form "MLL...L[Z]"')
+
+        return self.coords.reshape(-1, 2), closed
+
+    def _keep(self, mask) -> int:
+        xy, closed = self._polyline()
+        count = int(mask.sum())
+
+        self.coords = xy[mask].ravel()
+        self.commands = ('M' + 'L' * (count - 1) if count else '') + ('Z' if closed else '')
+
+        return len(xy) - count
+
+    def simplify(self, tolerance: float, method: str = 'douglas-peucker') -> int:
+        """
+        Removes the points of an array backed polyline that do not change its shape by more than tolerance
+
+        :param tolerance: for 'douglas-peucker' the largest distance of a removed point from the simplified line,
+        for 'visvalingam' the smallest area a point has to add to the line to be kept
+        :param method: 'douglas-peucker' or 'visvalingam'
+        :return: number of removed points
+        """
+        xy, _ = self._polyline()
+        if method == 'douglas-peucker':
+            return self._keep(douglas_peucker(xy, tolerance))
+        if method == 'visvalingam':
+            return self._keep(visvalingam(xy, tolerance))
+
+        raise ValueError(f'unknown simplification method {method!r}')
+
+    def decimate(self, width: float = 1) -> int:
+        """
+        Reduces an array backed polyline with increasing x values (e.g. a time series) to the first, last,
+        lowest and highest point per column of the given width, which preserves the drawn line at that resolution
+
+        :param width: width of a pixel column in the units of the x coordinates
+        :return: number of removed points
+        """
+        xy, _ = self._polyline()
+        return self._keep(minmax_decimate(xy, width))
+
+    def _validate(self, options=DEFAULT):
+        valid = super(Path, self)._validate(options)
 
         # path #########################################################################################################
-        if self.points is not None:
-            d = ', '.join([' '.join([str(p) for p in point if str(p) != '']) for point in self.points])
-            self.valid['d'] = f'd="{d}"'
+        if self.commands is not None:
+            d = _path_data(self.commands, self.coords, self.relative, self.elide, options)
+            valid['d'] = f'd="{d}"'
+
+        elif self.points is not None:
+            d = ', '.join([' '.join([options.num(p) for p in point if str(p) != '']) for point in self.points])
+            valid['d'] = f'd="{d}"'
+
+        return valid
 
     def copy(self, item: 'Path' = None):
         item = super().copy(Path()) if item is None else super().copy(item)
 
         item.points = self.points
+        item.commands = self.commands
+        item.coords = self.coords
+        item.relative = self.relative
+        item.elide = self.elide
 
         return item
@@ -1,4 +1,5 @@
 from .Base import Base
+from ..Render import DEFAULT
 
 
 class Rect(Base):
@@ -8,6 +9,8 @@ class Rect(Base):
     Represents a rectangle SVG element.
     """
 
+    __slots__ = ('x', 'y', 'w', 'h', 'rx', 'ry')
+
     def __init__(self, x=0, y=0, w='100%', h='100%', rx=None, ry=None, **kwargs):
         """
         :param x: x coordinate of the left, bottom coordinate of the rectangle
@@ -32,27 +35,29 @@ class Rect(Base):
         self.rx = rx
         self.ry = ry
 
-    def _validate(self):
-        super(Rect, self)._validate()
+    def _validate(self, options=DEFAULT):
+        valid = super(Rect, self)._validate(options)
         s = super(Rect, self)._get_string_value
 
         # x ############################################################################################################
-        self.valid['x'] = s(self.x, 'x')
+        valid['x'] = s(self.x, 'x', options)
 
         # y ############################################################################################################
-        self.valid['y'] = s(self.y, 'y')
+        valid['y'] = s(self.y, 'y', options)
 
         # w ############################################################################################################
-        self.valid['w'] = s(self.w, 'width')
+        valid['w'] = s(self.w, 'width', options)
 
         # h ############################################################################################################
-        self.valid['h'] = s(self.h, 'height')
+        valid['h'] = s(self.h, 'height', options)
 
         # rx ###########################################################################################################
-        self.valid['rx'] = s(self.rx, 'rx')
+        valid['rx'] = s(self.rx, 'rx', options)
 
         # ry ###########################################################################################################
-        self.valid['ry'] = s(self.ry, 'ry')
+        valid['ry'] = s(self.ry, 'ry', options)
+
+        return valid
 
     def copy(self, item: 'Rect' = None):
         item = super().copy(Rect()) if item is None else super().copy(item)
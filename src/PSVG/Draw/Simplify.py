@@ -0,0 +1,121 @@
+import heapq
+
+import numpy as np
+
+
+def douglas_peucker(xy: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker simplification of a polyline
+
+    :param xy: (n, 2) array of points
+    :param tolerance: largest distance a removed point may have from the simplified line
+    :return: boolean mask of the points to keep
+    """
+    n = len(xy)
+    keep = np.zeros(n, dtype=bool)
+    if n:
+        keep[[0, -1]] = True
+
+    stack = [(0, n - 1)] if n > 2 else []
+    while stack:
+        beg, end = stack.pop()
+        (x0, y0), (x1, y1) = xy[beg], xy[end]
+        inner = xy[beg + 1:end]
+
+        dx, dy = x1 - x0, y1 - y0
+        length = np.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(inner[:, 0] - x0, inner[:, 1] - y0)
+        else:
+            dist = np.abs(dy * (inner[:, 0] - x0) - dx * (inner[:, 1] - y0)) / length
+
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = beg + 1 + i
+            keep[mid] = True
+            if mid - beg > 1:
+                stack.append((beg, mid))
+            if end - mid > 1:
+                stack.append((mid, end))
+
+    return keep
+
+
+def visvalingam(xy: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Visvalingam-Whyatt simplification of a polyline
+
+    :param xy: (n, 2) array of points
+    :param tolerance: smallest effective area (area of the triangle with its neighbours) a kept point may have
+    :return: boolean mask of the points to keep
+    """
+    n = len(xy)
+    keep = np.ones(n, dtype=bool)
+    if n < 3:
+        return keep
+
+    x, y = xy[:, 0].tolist(), xy[:, 1].tolist()
+    prev = list(range(-1, n - 1))
+    succ = list(range(1, n + 1))
+
+    def area(i):
+        a, b = prev[i], succ[i]
+        return abs((x[a] - x[i]) * (y[b] - y[i]) - (x[b] - x[i]) * (y[a] - y[i])) / 2
+
+    areas = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        areas[i] = area(i)
+        heap.append((areas[i], i))
+    heapq.heapify(heap)
+
+    while heap:
+        value, i = heapq.heappop(heap)
+        if not keep[i] or value != areas[i]:
+            continue
+        if value >= tolerance:
+            break
+
+        keep[i] = False
+        a, b = prev[i], succ[i]
+        succ[a], prev[b] = b, a
+
+        # a removed point's area is carried over so neighbours never drop below it
+        for j in (a, b):
+            if 0 < j < n - 1:
+                areas[j] = max(area(j), value)
+                heapq.heappush(heap, (areas[j], j))
+
+    return keep
+
+
+def minmax_decimate(xy: np.ndarray, width: float) -> np.ndarray:
+    """
+    Keeps the first, last, lowest and highest point of every column of the given width.
+    The rendered line covers the same pixels as the full line if width matches one pixel.
+
+    :param xy: (n, 2) array of points with non decreasing x values (e.g. a time series)
+    :param width: width of a column in the units of x
+    :return: boolean mask of the points to keep
+    """
+    if not width > 0:
+        raise ValueError(f'min/max decimation needs a positive column width, got {width}')
+
+    n = len(xy)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+
+    columns = np.floor((xy[:, 0] - xy[0, 0]) / width).astype(np.int64)
+    if (np.diff(columns) < 0).any():
+        raise ValueError('min/max decimation needs points sorted by x')
+
+    firsts = np.flatnonzero(np.diff(columns, prepend=columns[0] - 1))
+    lasts = np.append(firsts[1:] - 1, n - 1)
+
+    # within each column the points sorted by y, first one is the minimum, last one the maximum
+    order = np.lexsort((xy[:, 1], columns))
+    keep[firsts] = keep[lasts] = True
+    keep[order[firsts]] = keep[order[lasts]] = True
+
+    return keep
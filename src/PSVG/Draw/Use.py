@@ -0,0 +1,65 @@
+from .Base import Base
+from ..Render import DEFAULT
+
+
+class Use(Base):
+    __slots__ = ('href', 'x', 'y', 'angle', 'scale')
+
+    def __init__(self, href='', x=0, y=0, angle=0, scale=1, **kwargs):
+        """
+        Concrete Implementation of `Draw.Base`
+
+        Places an instance of a definition registered with `SVG.Document.define`.
+        Presentation attributes (fill, stroke, ...) set here are inherited by the parts of the definition
+        that do not set them themselves.
+
+        :param href: id of the definition
+        :param x: x coordinate the origin of the definition is moved to
+        :param y: y coordinate the origin of the definition is moved to
+        :param angle: rotation in degrees around (x, y)
+        :param scale: scaling factor around (x, y)
+        """
+        super().__init__(name='use', **kwargs)
+
+        self.href = href
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.scale = scale
+
+        self.type = 'use'
+
+    def _validate(self, options=DEFAULT):
+        valid = super(Use, self)._validate(options)
+        s = super(Use, self)._get_string_value
+
+        # href #########################################################################################################
+        valid['href'] = f'href="#{self.href}"'
+
+        if self.angle != 0 or self.scale != 1:
+            # transform ################################################################################################
+            transform = f'translate({options.num(self.x)} {options.num(self.y)})'
+            if self.angle != 0:
+                transform += f' rotate({options.num(self.angle)})'
+            if self.scale != 1:
+                transform += f' scale({options.num(self.scale)})'
+            valid['transform'] = f'transform="{transform}"'
+        else:
+            # x ########################################################################################################
+            valid['x'] = s(self.x, 'x', options)
+
+            # y ########################################################################################################
+            valid['y'] = s(self.y, 'y', options)
+
+        return valid
+
+    def copy(self, item: 'Use' = None):
+        item = super().copy(Use()) if item is None else super().copy(item)
+
+        item.href = self.href
+        item.x = self.x
+        item.y = self.y
+        item.angle = self.angle
+        item.scale = self.scale
+
+        return item
@@ -2,3 +2,5 @@ from .Circle import Circle
 from .Rectangle import Rect
 from .Path import Path
 from .Base import Base
+from .Batch import CircleBatch, RectBatch
+from .Use import Use
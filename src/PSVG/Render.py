@@ -0,0 +1,145 @@
+import numpy as np
+
+
+class RenderOptions:
+    """
+    Settings for turning an svg tree into text, handed down through every construct call.
+
+    - minify: drops indentation and line breaks
+    - precision: number of decimals floats are rounded to (trailing zeros are dropped), None keeps str() output
+    - classes: moves the presentation attributes of drawn objects (fill, stroke, ...) into css classes,
+      one per distinct combination, defined once in a style element under the root of the tree
+    - embed_fonts: embeds the fonts of all Text elements as @font-face rules in a defs element under the root,
+      each subset to the characters the tree uses (see `Text.Font.font_face`)
+    - cache: stores the output of every drawn object on it, so that constructing the tree again only re-renders
+      the objects whose attributes were assigned since. Costs memory in the size of the output, so it is off by
+      default. In place changes (e.g. appending to Path.points) are only seen after a call to touch() on the object.
+      Without cache constructing neither reads nor writes cached output and leaves the tree untouched, e.g. for
+      templates shared between threads. Streaming (Tree.write, iter_construct, ...) never uses the cache.
+
+    The default options reproduce the classic indented output.
+    """
+    __slots__ = ('minify', 'precision', 'classes', 'embed_fonts', 'cache', 'styles', 'prologue', 'key')
+
+    def __init__(self, minify=False, precision=None, classes=False, embed_fonts=False, cache=False):
+        self.minify = minify
+        self.precision = precision
+        self.classes = classes
+        self.embed_fonts = embed_fonts
+        self.cache = cache
+
+        # filled by prepare: css class name per distinct style and the elements emitted right after the root header
+        self.styles = None
+        self.prologue = ()
+
+        # identifies the output these options produce, cached fragments are only reused for the same key
+        self.key = (minify, precision)
+
+    def prepare(self, root) -> 'RenderOptions':
+        """
+        Runs the passes over the whole tree that the options need before anything can be emitted
+
+        :param root: root node of the tree about to be constructed
+        :return: these options
+        """
+        if not (self.embed_fonts or self.classes):
+            return self
+
+        fonts = self._collect_fonts(root) if self.embed_fonts else ()
+        styles = self._collect_styles(root) if self.classes else ()
+
+        # the prologue is part of the output of the root, so it has to be part of the key as well
+        self.prologue = fonts + styles
+        self.key = (self.minify, self.precision, None if self.styles is None else tuple(self.styles), fonts)
+        return self
+
+    @staticmethod
+    def _walk(root):
+        """
+        :return: generator yielding the active nodes of the tree in document order
+        """
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if getattr(node, 'active', True) is False:
+                continue
+
+            yield node
+            stack.extend(reversed(node._edges))
+
+    def _collect_fonts(self, root) -> tuple:
+        # fonts are dictionaries and not hashable, they are told apart by identity
+        codepoints = {}
+        for node in self._walk(root):
+            font = getattr(node, 'font', None)
+            if hasattr(font, 'font_face'):
+                # batches hold an array of strings, whose str() would be an abbreviated repr
+                text = node.text if isinstance(node.text, str) else ''.join(map(str, np.ravel(node.text)))
+                codepoints.setdefault(id(font), (font, set()))[1].update(map(ord, text))
+
+        rules = [font.font_face(chars) for font, chars in codepoints.values()]
+        return (f'<defs><style>{"".join(rules)}</style></defs>',) if rules else ()
+
+    def _collect_styles(self, root) -> tuple:
+        styles = {}
+        for node in self._walk(root):
+            style = node._style(self) if hasattr(node, '_style') else ()
+            if style and style not in styles:
+                styles[style] = f's{len(styles)}'
+
+        rules = []
+        for style, name in styles.items():
+            declarations = ';'.join([attribute[:-1].replace('="', ':', 1) for attribute in style])
+            rules.append(f'.{name}{{{declarations}}}')
+
+        self.styles = styles
+        return (f'<style>{"".join(rules)}</style>',) if rules else ()
+
+    @property
+    def newline(self):
+        return '' if self.minify else '\n'
+
+    def tab(self, depth):
+        return '' if self.minify else '   ' * depth
+
+    def num(self, value) -> str:
+        """
+        Formats a single attribute value, rounding floats to the configured precision
+        """
+        if self.precision is None or not isinstance(value, (float, np.floating)):
+            return str(value)
+
+        return self._round(float(value))
+
+    def nums(self, values) -> list[str]:
+        """
+        Formats an array of attribute values, see num
+        """
+        values = np.asarray(values)
+        if self.precision is None or values.dtype.kind != 'f':
+            return [str(i) for i in values.tolist()]
+
+        rounded = values.round(self.precision)
+        if np.isfinite(rounded).all() and (rounded == np.trunc(rounded)).all():
+            return [str(i) for i in rounded.astype(np.int64).tolist()]
+
+        return [self._round(i) for i in rounded.tolist()]
+
+    def _round(self, value: float) -> str:
+        s = f'{value:.{self.precision}f}'
+        if '.' in s:
+            s = s.rstrip('0').rstrip('.')
+
+        return '0' if s == '-0' else s
+
+
+DEFAULT = RenderOptions()
+
+
+class Slot(str):
+    """
+    Marker assigned to an attribute while a `SVG.Template` is compiled.
+    It is written into the svg definition unchanged, in place of the formatted attribute value.
+    """
+    __slots__ = ()
+
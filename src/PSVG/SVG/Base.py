@@ -1,46 +1,125 @@
 from ..Data_Structures import Node, Graph
+from ..Render import RenderOptions, DEFAULT
 from math import sin, cos, pi
+import asyncio
+import inspect
+import os
+import zlib
 
 
-class SVG(Node):
+class Container(Node):
     """
-    Implementation of `Data_Structures.Node`
+    Abstract Class
 
-    Represents an SVG Object which can either be an entire document or just a branch in a larger SVG tree
+    Implementation of `Data_Structures.Node` shared by the elements that wrap their children,
+    i.e. everything between header() and footer().
+
+    Branches are not cached, only the drawn objects at the leaves keep their output (see `Draw.Base`),
+    so that constructing an unchanged branch again only joins the cached strings.
+    """
+    __slots__ = ()
+
+    def header(self, options: RenderOptions = DEFAULT):
+        raise NotImplementedError
+
+    def footer(self):
+        return f'</{self.type}>'
+
+    @staticmethod
+    def _prologue(depth, options: RenderOptions):
+        """
+        :return: the elements options place right after the header of the root of the tree
+        """
+        if depth != 0:
+            return []
+
+        tab = options.tab(1)
+        return [f'{tab}{i}' for i in options.prologue]
+
+    def construct(self, depth, options: RenderOptions = DEFAULT):
+        """
+        Constructs the svg definition
+        :param depth: current depth of this node in the svg tree
+        :param options: output settings (minification, numeric precision)
+        :return: String containing the svg definition for this branch
+        """
+        if self.active is False:
+            return ''
+
+        tab = options.tab(depth)
+        body = [i for i in [node.construct(depth + 1, options) for node in self._edges] if i != '']
+        body = [f'{tab}{self.header(options)}'] + self._prologue(depth, options) + body + [f'{tab}{self.footer()}']
+        return options.newline.join(body)
+
+    def iter_construct(self, depth, options: RenderOptions = DEFAULT):
+        """
+        Lazily constructs the svg definition of this branch, one element at a time.
+
+        :param depth: current depth of this node in the svg tree
+        :param options: output settings (minification, numeric precision)
+        :return: generator yielding the fragments of the svg definition in document order
+        """
+        if self.active is False:
+            return
+
+        tab = options.tab(depth)
+        yield f'{tab}{self.header(options)}'
+        yield from self._prologue(depth, options)
+
+        depth += 1
+        for node in self._edges:
+            yield from node.iter_construct(depth, options)
+
+        yield f'{tab}{self.footer()}'
+
+
+class SVG(Container):
     """
+    Implementation of `Container`
 
-    def __init__(self, w=0, h=0, xmlns='', active=True):
+    Represents an SVG Object which can either be an entire document or just a branch in a larger SVG tree
+    """
+    __slots__ = ('type', 'w', 'h', 'x', 'y', 'xmlns', 'active')
+
+    def __init__(self, w=0, h=0, xmlns='', active=True, x=None, y=None):
+        """
+        :param w: width of the svg
+        :param h: height of the svg
+        :param xmlns: namespace declaration, only needed for the root of a document
+        :param active: inactive svgs are left out of the svg definition
+        :param x: optional x coordinate of a nested svg inside its parent
+        :param y: optional y coordinate of a nested svg inside its parent
+        """
         super().__init__('svg')
         self.type = 'svg'
 
         self.w = w
         self.h = h
+        self.x = x
+        self.y = y
         self.xmlns = xmlns
         self.active = active
 
-    def construct(self, depth):
-        tab = '   ' * depth
-        header = [f'{tab}<svg width="{self.w}" height="{self.h}" {self.xmlns}>']
-        footer = [f'{tab}</svg>']
-
-        depth += 1
-        body = [i for i in [node.construct(depth) for node in self.edges] if i != '']
-
-        return f'\n'.join(header + body + footer)
+    def header(self, options: RenderOptions = DEFAULT):
+        xmlns = '' if options.minify and not self.xmlns else f' {self.xmlns}'
+        xy = ''.join([f' {k}="{options.num(v)}"' for k, v in (('x', self.x), ('y', self.y)) if v is not None])
+        return f'<svg width="{options.num(self.w)}" height="{options.num(self.h)}"{xy}{xmlns}>'
 
     def copy(self):
         if self.active is False:
             return ''
 
-        svg = SVG(w=self.w, h=self.h, xmlns=self.xmlns, active=self.active)
+        svg = SVG(w=self.w, h=self.h, xmlns=self.xmlns, active=self.active, x=self.x, y=self.y)
 
-        for node in self.edges:
+        for node in self._edges:
             svg.add_child(node.copy())
 
         return svg
 
 
-class G(Node):
+class G(Container):
+    __slots__ = ('type', 'angle', 'x', 'y', 'xc', 'yc', 'xscale', 'yscale', 'active')
+
     def __init__(self, x=0, y=0, angle=0, xc=0, yc=0, xscale=1, yscale=1, active=True):
         super().__init__('g')
         self.type = 'g'
@@ -58,7 +137,7 @@ class G(Node):
 
         self.active = active
 
-    def header(self):
+    def header(self, options: RenderOptions = DEFAULT):
         x, y = self.x, self.y
 
         xc, yc = self.xc, self.yc
@@ -71,31 +150,71 @@ class G(Node):
         xn = x + xc * (1 + xs * s - xs * c)
         yn = y + yc * (1 - ys * s - ys * c)
 
-        return f'<g transform="matrix({xs * c},{ys * s},{xs * -s},{ys * c},{xn},{yn})">'
-
-    def construct(self, depth):
-        if self.active is False:
-            return ''
-
-        tab = '   ' * depth
-        header = [f'{tab}{self.header()}']
-        footer = [f'{tab}</g>']
-
-        depth += 1
-        body = [i for i in [node.construct(depth) for node in self.edges] if i != '']
-
-        return f'\n'.join(header + body + footer)
+        matrix = ','.join([options.num(i) for i in (xs * c, ys * s, xs * -s, ys * c, xn, yn)])
+        return f'<g transform="matrix({matrix})">'
 
     def copy(self):
         g = G(x=self.x, y=self.y, angle=self.angle,
               xc=self.xc, yc=self.yc, xscale=self.xscale, yscale=self.yscale, active=self.active)
 
-        for node in self.edges:
+        for node in self._edges:
             g.add_child(node.copy())
 
         return g
 
 
+class Defs(Container):
+    """
+    Implementation of `Container`
+
+    Holds the definitions of a document, i.e. subtrees that are not drawn themselves
+    but placed any number of times through `Draw.Use` elements
+    """
+    __slots__ = ('type', 'active')
+
+    def __init__(self, active=True):
+        super().__init__('defs')
+        self.type = 'defs'
+        self.active = active
+
+    def header(self, options: RenderOptions = DEFAULT):
+        return '<defs>'
+
+    def copy(self):
+        defs = Defs(active=self.active)
+
+        for node in self._edges:
+            defs.add_child(node.copy())
+
+        return defs
+
+
+class Symbol(Container):
+    """
+    Implementation of `Container`
+
+    Group inside of `Defs` that gives a definition the id its `Draw.Use` instances refer to
+    """
+    __slots__ = ('type', 'id', 'active')
+
+    def __init__(self, id, active=True):
+        super().__init__('g')
+        self.type = 'g'
+        self.id = id
+        self.active = active
+
+    def header(self, options: RenderOptions = DEFAULT):
+        return f'<g id="{self.id}">'
+
+    def copy(self):
+        symbol = Symbol(self.id, active=self.active)
+
+        for node in self._edges:
+            symbol.add_child(node.copy())
+
+        return symbol
+
+
 class Tree(Graph):
     def __init__(self):
         super().__init__()
@@ -113,8 +232,166 @@ class Tree(Graph):
 
         self.addChild(child.root)
 
-    def construct(self):
-        return self.root.construct(0)
+    def construct(self, parallel: int = None, mp_context=None, **options):
+        """
+        Constructs the svg definition of the whole tree
+
+        :param parallel: number of processes the branches directly below the root (sections, tables, ...) are
+        rendered in, see `SVG.Parallel`. Pays off for large trees only, since starting the processes takes time.
+        :param mp_context: multiprocessing context the processes are started with, None for the start method
+        configured with multiprocessing.set_start_method
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        :return: String containing the svg definition
+        """
+        options = RenderOptions(**options).prepare(self.root)
+        if parallel and parallel > 1 and isinstance(self.root, Container):
+            from .Parallel import construct
+            return construct(self.root, options, parallel, mp_context)
+
+        return self.root.construct(0, options)
+
+    def optimize(self) -> int:
+        """
+        Simplifies the tree without changing what it draws, see `SVG.Optimize.optimize`.
+        Meant as a last step before rendering: nodes removed from the tree (e.g. the inactive backgrounds of Tables
+        and TextBoxes, or the group of a Section) no longer have any effect when they are changed afterwards.
+
+        :return: number of removed nodes
+        """
+        from .Optimize import optimize
+        return optimize(self.root)
+
+    def iter_construct(self, **options):
+        """
+        Lazily constructs the svg definition of the whole tree
+
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        :return: generator yielding the fragments of the svg definition in document order
+        """
+        return self.root.iter_construct(0, self._stream_options(options))
+
+    def _stream_options(self, options: dict) -> RenderOptions:
+        """
+        :return: RenderOptions for streaming the tree. Streaming never stores output on the tree,
+        so that memory stays flat however large the tree is.
+        """
+        options = RenderOptions(**options).prepare(self.root)
+        options.cache = False
+        return options
+
+    def write(self, fp, chunk_size=65536, encoding=None, **options):
+        """
+        Streams the svg definition into a file-like object without building the whole string in memory.
+        Fragments are buffered and handed to fp.write in chunks of roughly chunk_size characters.
+
+        :param fp: any object with a write method (open file, socket.makefile(), io.StringIO, ...)
+        :param chunk_size: approximate number of characters buffered before each write
+        :param encoding: if given, chunks are encoded to bytes before writing (for binary files and sockets)
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        """
+        options = self._stream_options(options)
+        for chunk in self._iter_chunks(options, chunk_size):
+            fp.write(chunk if encoding is None else chunk.encode(encoding))
+
+    def _iter_chunks(self, options: RenderOptions, chunk_size):
+        """
+        Joins the fragments of iter_construct into chunks of roughly chunk_size characters
+        """
+        newline = options.newline
+
+        buffer = []
+        size = 0
+        sep = ''
+        for fragment in self.root.iter_construct(0, options):
+            buffer.append(sep)
+            buffer.append(fragment)
+            size += len(fragment) + 1
+            sep = newline
+
+            if size >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield ''.join(buffer)
+
+    def iter_svgz(self, level=9, chunk_size=65536, **options):
+        """
+        Lazily constructs the gzip compressed svg definition (the content of an .svgz file,
+        or a response body sent with Content-Encoding: gzip).
+        Fragments are compressed as they are constructed, the uncompressed document is never held in memory.
+
+        :param level: compression level from 0 (none) to 9 (smallest)
+        :param chunk_size: approximate number of characters compressed at a time
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        :return: generator yielding the compressed bytes
+        """
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+        options = self._stream_options(options)
+        for chunk in self._iter_chunks(options, chunk_size):
+            data = compressor.compress(chunk.encode('utf-8'))
+            if data:
+                yield data
+
+        yield compressor.flush()
+
+    def write_svgz(self, path_or_fp, level=9, chunk_size=65536, **options):
+        """
+        Streams the gzip compressed svg definition into a file, see iter_svgz
+
+        :param path_or_fp: path of the .svgz file to write or a binary file-like object
+        :param level: compression level from 0 (none) to 9 (smallest)
+        :param chunk_size: approximate number of characters compressed at a time
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        """
+        if isinstance(path_or_fp, (str, os.PathLike)):
+            with open(path_or_fp, 'wb') as fp:
+                self.write_svgz(fp, level, chunk_size, **options)
+            return
+
+        for data in self.iter_svgz(level, chunk_size, **options):
+            path_or_fp.write(data)
+
+    async def aiter_construct(self, chunk_size=65536, executor=None, **options):
+        """
+        Asynchronously constructs the svg definition of the whole tree, e.g. to stream it from a web server.
+        Everything, from the passes the options need to large branches and batches, is constructed in an executor,
+        one chunk at a time, so that the event loop never waits for more than a single chunk.
+
+        :param chunk_size: approximate number of characters per yielded chunk
+        :param executor: executor the tree is constructed in, None for the default executor of the loop
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        :return: asynchronous generator yielding the svg definition in chunks
+        """
+        loop = asyncio.get_running_loop()
+        options = await loop.run_in_executor(executor, self._stream_options, options)
+
+        # the chunks are built by one generator advanced in the executor, streaming never writes to the tree
+        chunks = self._iter_chunks(options, chunk_size)
+        while (chunk := await loop.run_in_executor(executor, next, chunks, None)) is not None:
+            yield chunk
+
+    async def awrite(self, writer, chunk_size=65536, encoding='utf-8', executor=None, **options):
+        """
+        Asynchronously streams the svg definition into a writer, see aiter_construct.
+        Works with asyncio.StreamWriter (drained after every chunk) and with writers whose write is a coroutine.
+
+        :param writer: object with a write method, optionally with a drain coroutine
+        :param chunk_size: approximate number of characters per write
+        :param encoding: chunks are encoded to bytes before writing, None writes strings
+        :param executor: executor the branches are constructed in, None for the default executor of the loop
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+        """
+        drain = getattr(writer, 'drain', None)
+        async for chunk in self.aiter_construct(chunk_size, executor, **options):
+            result = writer.write(chunk if encoding is None else chunk.encode(encoding))
+            if inspect.isawaitable(result):
+                await result
+            if drain is not None:
+                await drain()
 
 
 class Document(Tree):
@@ -122,12 +399,76 @@ class Document(Tree):
         super().__init__()
         self.root = SVG(xmlns='xmlns="http://www.w3.org/2000/svg"', **kwargs)
 
+    @property
+    def defs(self) -> Defs | None:
+        """
+        :return: the definitions of this document, None until the first call of define
+        """
+        return next((node for node in self.root.edges if isinstance(node, Defs)), None)
+
+    def define(self, item: 'Node | Tree', id: str = None) -> str:
+        """
+        Registers a subtree (a marker, a legend item, a TextBox, ...) once in the defs of this document.
+        The definition itself is not drawn, instead each `Draw.Use` referring to the returned id places an instance
+        of it, so that size and memory per instance do not grow with the size of the subtree.
+
+        The definition is shared by all instances, changing it changes all of them.
+
+        :param item: node or section to define
+        :param id: id of the definition, generated if omitted, has to differ from the ids of the other definitions
+        :return: id the instances refer to
+        """
+        defs = self.defs
+        if defs is None:
+            defs = Defs()
+            self.root.add_child(defs)
+
+            # definitions go first in the document
+            edges = self.root.edges
+            self.root.edges = {defs: edges.pop(defs), **edges}
+
+        ids = {node.id for node in defs.edges if isinstance(node, Symbol)}
+        if id is None:
+            # d<number> ids given by the caller are skipped
+            n = len(ids)
+            while f'd{n}' in ids:
+                n += 1
+            id = f'd{n}'
+        elif id in ids:
+            raise ValueError(f'the document already defines {id!r}')
+
+        symbol = Symbol(id)
+        symbol.add_child(item.root if isinstance(item, Tree) else item)
+        defs.add_child(symbol)
+
+        return id
+
     def copy(self):
+        """
+        Creates an independent copy of this document, node by node. See share for a copy in O(1).
+
+        :return: new Document
+        """
         d = Document()
         d.root = self.root.copy()
 
         return d
 
+    def share(self):
+        """
+        Creates a copy of this document in O(1) that shares all unchanged parts with this document (copy on write),
+        see `Data_Structures.Node.share`. Meant for templates that are copied and filled in many times.
+
+        Changes made to the copy never reach this document. This document however becomes the template of the copy:
+        changing it afterwards changes the copies as well, use copy where both have to stay independent.
+
+        :return: new Document
+        """
+        d = Document()
+        d.root = self.root.share()
+
+        return d
+
 
 class Section(Tree):
     def __init__(self, x=0, y=0, w=0, h=0):
@@ -140,8 +481,27 @@ class Section(Tree):
         self.svg.add_child(child)
 
     def copy(self):
+        """
+        Creates an independent copy of this section, node by node. See share for a copy in O(1).
+
+        :return: new Section
+        """
         s = Section()
         s.root = self.root.copy()
+        s.svg = next(node for node in s.root.edges if isinstance(node, SVG))
+
+        return s
+
+    def share(self):
+        """
+        Creates a copy of this section in O(1) that shares all unchanged parts with this section (copy on write),
+        see `Document.share`, which also applies to the template this section becomes
+
+        :return: new Section
+        """
+        s = Section()
+        s.root = self.root.share()
+        s.svg = next(node for node in s.root.edges if isinstance(node, SVG))
 
         return s
 
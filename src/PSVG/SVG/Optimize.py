@@ -0,0 +1,144 @@
+import numpy as np
+
+from ..Data_Structures import Node, Edge
+from ..Draw import Circle, Rect, Use, CircleBatch, RectBatch
+from ..Text import Text, TextBatch
+from .Base import SVG, G, Defs
+
+# attributes holding the x and y coordinates of the node types a translation can be folded into
+_COORDINATES = ((G, 'x', 'y'), (SVG, 'x', 'y'), (Use, 'x', 'y'), (Circle, 'cx', 'cy'), (Rect, 'x', 'y'),
+                (Text, 'x', 'y'), (CircleBatch, 'cx', 'cy'), (RectBatch, 'x', 'y'), (TextBatch, 'x', 'y'))
+
+
+def _coordinates(node: Node):
+    for cls, x, y in _COORDINATES:
+        if isinstance(node, cls):
+            return x, y
+
+    return None
+
+
+def _numeric(value) -> bool:
+    return np.asarray(value).dtype.kind in 'iuf'
+
+
+def _foldable(node: Node) -> bool:
+    """
+    :return: whether a translation of the parent can be moved into the coordinates of node
+    """
+    names = _coordinates(node)
+    if names is None or node.in_deg != 1:
+        return False
+
+    # a nested svg without coordinates sits at (0, 0)
+    default = 0 if isinstance(node, SVG) else None
+    return all([_numeric(default if getattr(node, i) is None else getattr(node, i)) for i in names])
+
+
+def _fold(node: Node, dx, dy):
+    x, y = _coordinates(node)
+    for name, d in ((x, dx), (y, dy)):
+        value = getattr(node, name)
+        value = 0 if value is None else value
+        setattr(node, name, value + d if np.ndim(value) == 0 else np.asarray(value) + d)
+
+
+def _translation(g: G):
+    """
+    :return: the (x, y) offset of a group that only translates its content, None for any other transformation
+    """
+    if g.angle % 360 != 0 or g.xscale != 1 or g.yscale != 1:
+        return None
+
+    if not (_numeric(g.x) and _numeric(g.y)):
+        return None
+
+    return g.x, g.y
+
+
+def _size(node: Node) -> int:
+    return 1 + sum([_size(child) for child in node._edges])
+
+
+def _relink(parent: Node, children: list):
+    """
+    Replaces the children of parent, keeping the edges (and weights) of the children it already had
+    """
+    old = parent.edges
+    edges = {}
+    for child in children:
+        edges[child] = old[child] if child in old else Edge(parent, child)
+        if parent not in child._ins:
+            child._ins += (parent,)
+
+    for child in old:
+        if child not in edges:
+            child._ins = tuple([i for i in child._ins if i is not parent])
+
+    parent.edges = edges
+
+
+def _visit(node: Node, root=False):
+    """
+    Optimizes the subtree of node
+
+    :return: the nodes taking the place of node in its parent and the number of removed nodes
+    """
+    removed = 0
+    children = []
+    for child in list(node.edges):
+        if getattr(child, 'active', True) is False:
+            removed += _size(child)
+            continue
+
+        replacement, count = _visit(child)
+        children += replacement
+        removed += count
+
+    if children != list(node._edges):
+        _relink(node, children)
+
+    if root:
+        return [node], removed
+
+    # empty groups, nested svgs and defs draw nothing
+    if not children and isinstance(node, (G, SVG, Defs)):
+        return [], removed + 1
+
+    # groups that only translate their content are replaced by their children,
+    # with the translation moved into the coordinates of the children
+    if isinstance(node, G) and node.in_deg == 1:
+        offset = _translation(node)
+        if offset is not None:
+            identity = offset[0] == 0 and offset[1] == 0
+            if identity or all([_foldable(child) for child in children]):
+                if not identity:
+                    for child in children:
+                        _fold(child, *offset)
+
+                _relink(node, [])
+                return children, removed + 1
+
+    return [node], removed
+
+
+def optimize(root: Node) -> int:
+    """
+    Simplifies a tree in place without changing what it draws:
+    - removes inactive nodes together with their subtrees
+    - removes groups, nested svgs and defs without content
+    - replaces groups without transformation by their content
+    - replaces groups that only translate their content by their content,
+      if the translation can be added to the coordinates of every child (numeric x/y, cx/cy, nested svg position)
+      which also merges chains of translating groups
+
+    Nodes shared by several parents are never moved. Copies made by `Data_Structures.Node.share` (e.g. through
+    Document.share) are cloned where they change, so optimizing a copy leaves its template untouched.
+
+    :param root: root of the tree
+    :return: number of removed nodes
+    """
+    if root is None:
+        return 0
+
+    return _visit(root, root=True)[1]
@@ -0,0 +1,101 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+
+from ..Data_Structures import Node
+from ..Render import RenderOptions
+from .Base import Container
+
+# Where the start method is fork, the workers inherit the nodes to render from this module instead of receiving
+# them pickled, so that only the rendered strings travel between processes.
+# The lock keeps concurrent calls from replacing the nodes while workers are being forked.
+_inherited = None
+_inherited_lock = Lock()
+
+
+def _construct(node: Node, depth, options: RenderOptions):
+    if isinstance(node, int):
+        node, options = _inherited[0][node], _inherited[1]
+
+    return node.construct(depth, options)
+
+
+def _construct_root(root: Node, options: dict):
+    if isinstance(root, int):
+        root = _inherited[0][root]
+
+    return root.construct(0, RenderOptions(**options).prepare(root))
+
+
+def _map(function, nodes, options, workers, *args, mp_context=None):
+    """
+    Calls function(node, *args, options) for every node in a process pool, in order
+    """
+    global _inherited
+
+    # the start method configured with multiprocessing.set_start_method unless a context is given
+    context = mp_context or multiprocessing.get_context()
+    with _inherited_lock:
+        if context.get_start_method() != 'fork':
+            items = nodes
+        else:
+            _inherited = (nodes, options)
+            items = range(len(nodes))
+
+        executor = ProcessPoolExecutor(max_workers=min(workers or len(nodes), len(nodes)), mp_context=context)
+        try:
+            # processes are started while the tasks are submitted
+            results = executor.map(function, items, *[[arg] * len(nodes) for arg in args], [options] * len(nodes),
+                                   chunksize=max(1, len(nodes) // (4 * (workers or 1))))
+        finally:
+            _inherited = None
+
+    with executor:
+        return list(results)
+
+
+def construct(root: Container, options: RenderOptions, workers: int, mp_context=None) -> str:
+    """
+    Constructs the svg definition of a tree, rendering the branches directly below the root in a process pool.
+    Leaves are constructed in this process.
+
+    :param root: root of the tree, the options have to be prepared for it
+    :param options: output settings
+    :param workers: number of processes
+    :param mp_context: multiprocessing context the processes are started with, None for the configured start method
+    :return: String containing the svg definition
+    """
+    if root.active is False:
+        return ''
+
+    nodes = list(root._edges)
+    jobs = [node for node in nodes if isinstance(node, Container) and node.active is not False]
+
+    fragments = {}
+    if jobs:
+        fragments = dict(zip(jobs, _map(_construct, jobs, options, workers, 1, mp_context=mp_context)))
+
+    body = [fragments[node] if node in fragments else node.construct(1, options) for node in nodes]
+
+    tab = options.tab(0)
+    body = [f'{tab}{root.header(options)}'] + root._prologue(0, options) + \
+           [i for i in body if i != ''] + [f'{tab}{root.footer()}']
+
+    return options.newline.join(body)
+
+
+def render_many(documents, workers: int = None, mp_context=None, **options) -> list[str]:
+    """
+    Constructs the svg definitions of many trees (e.g. Documents) in a process pool
+
+    :param documents: trees to construct
+    :param workers: number of processes, defaults to the number of cores
+    :param mp_context: multiprocessing context the processes are started with, None for the configured start method
+    :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2, classes=True
+    :return: svg definition per tree, in order
+    """
+    roots = [document.root for document in documents]
+    if not roots:
+        return []
+
+    return _map(_construct_root, roots, options, workers or multiprocessing.cpu_count(), mp_context=mp_context)
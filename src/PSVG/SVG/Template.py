@@ -0,0 +1,163 @@
+import re
+
+from ..Draw.Base import Base
+from ..Render import RenderOptions, Slot
+from .Base import Tree, Container
+
+# markers written in place of the bound attributes while compiling, \x00 never appears in an svg definition
+_MARKER = re.compile('\x00([0-9]+)\x00')
+
+
+def _text(value, options: RenderOptions):
+    return str(value)
+
+
+def _color(value, options: RenderOptions):
+    color = Base._color2hex(value)
+    return '' if color is None else color
+
+
+def _opacity(value, options: RenderOptions):
+    if value < 0:
+        value = 0
+    if value > 1:
+        value = 1
+
+    return options.num(value)
+
+
+def _dashes(value, options: RenderOptions):
+    return ' '.join([options.num(i) for i in value])
+
+
+def _number(value, options: RenderOptions):
+    return options.num(value)
+
+
+class Template:
+    """
+    Precompiled svg definition of a Document or Section whose structure is fixed.
+
+    The tree is constructed once with a marker in place of every bound attribute and split into static fragments,
+    so that rendering only formats the slot values and joins the fragments, without walking or validating the tree.
+
+    Slots bind attributes of drawn objects that are written into the svg definition as they are
+    (e.g. Text.text, Rect.w, Rect.fill, Circle.r), attributes used in calculations (e.g. G.x) cannot be bound.
+    Changes made to the tree after compiling are not picked up, compile a new template instead.
+    """
+
+    # formatting of slot values per attribute, mirroring Draw.Base._validate, anything else is a number
+    _formats = {'text': _text, 'fill': _color, 'stroke': _color,
+                'fill_opacity': _opacity, 'stroke_opacity': _opacity, 'stroke_dasharray': _dashes}
+
+    def __init__(self, tree: Tree, slots: dict, **options):
+        """
+        :param tree: Document or Section to compile
+        :param slots: (node, attribute name) or a list of them per slot name,
+        e.g. {'name': (text, 'text'), 'bar': [(rect, 'w'), (label, 'x')]}
+        :param options: keyword arguments of `RenderOptions`, e.g. minify=True, precision=2
+        """
+        self.options = RenderOptions(**options)
+
+        # slot name, node, attribute and formatting function per marker
+        self._bindings = []
+        for name, bindings in slots.items():
+            for node, attribute in [bindings] if isinstance(bindings, tuple) else bindings:
+                self._check(name, node, attribute)
+                self._bindings.append((name, node, attribute, self._formats.get(attribute, _number)))
+
+        self._parts, self._positions, self.defaults = self._compile(tree, options)
+
+    def _check(self, name, node, attribute):
+        """
+        Renders node on its own with a marker in place of attribute, to reject attributes that are not written into
+        the svg definition as they are before the whole tree is constructed
+        """
+        try:
+            value = getattr(node, attribute)
+        except AttributeError:
+            raise ValueError(f'slot {name!r}: {type(node).__name__} has no attribute {attribute!r}') from None
+
+        # classes need the styles of the whole tree, they make no difference here
+        options = RenderOptions(minify=self.options.minify, precision=self.options.precision)
+        try:
+            setattr(node, attribute, Slot('\x00'))
+            s = node.header(options) if isinstance(node, Container) else node._render(options)
+        except Exception:
+            s = ''
+        finally:
+            setattr(node, attribute, value)
+
+        if '\x00' not in ''.join(s):
+            raise ValueError(f'slot {name!r}: {type(node).__name__}.{attribute} is used in calculations '
+                             f'or not written into the svg definition and can not be bound')
+
+    def _compile(self, tree: Tree, options: dict):
+        originals = []
+        try:
+            for i, (name, node, attribute, _) in enumerate(self._bindings):
+                originals.append((node, attribute, getattr(node, attribute)))
+                setattr(node, attribute, Slot(f'\x00{i}\x00'))
+
+            parts = _MARKER.split(tree.construct(**options))
+
+        finally:
+            for node, attribute, value in reversed(originals):
+                setattr(node, attribute, value)
+
+        # indices of parts filled by each slot, with the formatting function of the bound attribute
+        positions = {name: [] for name, _, _, _ in self._bindings}
+        for index in range(1, len(parts), 2):
+            name, _, _, fmt = self._bindings[int(parts[index])]
+            positions[name].append((index, fmt))
+
+        missing = [name for name, found in positions.items() if not found]
+        if missing:
+            raise ValueError(f'slots {missing} are not part of the svg definition (inactive or not in the tree)')
+
+        # the values of the tree serve as defaults
+        defaults = {}
+        for (name, _, _, fmt), (_, _, value) in zip(self._bindings, originals):
+            if value is not None:
+                defaults.setdefault(name, value)
+
+        for index in range(1, len(parts), 2):
+            name, _, _, fmt = self._bindings[int(parts[index])]
+            parts[index] = fmt(defaults[name], self.options) if name in defaults else None
+
+        return parts, positions, defaults
+
+    def render(self, **values) -> str:
+        """
+        Substitutes the slot values into the precompiled svg definition
+
+        :param values: value per slot name, slots left out keep the value of the compiled tree
+        :return: String containing the svg definition
+        """
+        parts = self._parts.copy()
+        options = self.options
+        for name, value in values.items():
+            try:
+                positions = self._positions[name]
+            except KeyError:
+                raise ValueError(f'unknown slot {name!r}') from None
+
+            for index, fmt in positions:
+                parts[index] = fmt(value, options)
+
+        try:
+            return ''.join(parts)
+        except TypeError:
+            missing = [name for name in self._positions if name not in values and name not in self.defaults]
+            raise ValueError(f'no value given for slots {missing}') from None
+
+    def write(self, fp, encoding=None, **values):
+        """
+        Renders the template into a file-like object, see render
+
+        :param fp: any object with a write method
+        :param encoding: if given, the svg definition is encoded to bytes before writing
+        :param values: value per slot name
+        """
+        s = self.render(**values)
+        fp.write(s if encoding is None else s.encode(encoding))
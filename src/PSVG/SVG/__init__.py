@@ -1 +1,3 @@
-from .Base import SVG, G, Tree, Section, Document
+from .Base import SVG, G, Defs, Symbol, Tree, Section, Document
+from .Template import Template
+from .Parallel import render_many
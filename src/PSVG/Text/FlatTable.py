@@ -0,0 +1,272 @@
+import numpy as np
+
+from .Text import Text
+from .TextBatch import TextBatch
+from ..Draw import RectBatch
+from ..SVG import Section, Document
+
+# text anchor per alignment (0: left, 1: center, 2: right), as used by TextBox
+_ANCHORS = np.array(['start', 'middle', 'end'], dtype=object)
+
+
+class FlatTable(Section):
+    """
+    Table for large, column oriented data.
+
+    Instead of a TextBox per cell, the cells are drawn by a single `TextBatch` and the row and column backgrounds
+    by one `Draw.RectBatch` each. Sizes, alignments and colors are kept in arrays,
+    so building and rendering the table costs a few array operations per row instead of several nodes per cell.
+    """
+
+    def __init__(self, text: Text, columns, header=None, header_text: Text = None, x=0, y=0):
+        """
+        :param text: template for the font, size and color of the cells
+        :param columns: list of columns, each a sequence with one value per row
+        :param header: optional list with one title per column, drawn as an extra row above the data
+        :param header_text: template for the font, size and color of the header, defaults to text
+        :param x: x coordinate of the table
+        :param y: y coordinate of the table
+        """
+        super().__init__(x, y)
+        self.text = text
+        self.header_text = text if header_text is None else header_text
+
+        self.data = np.column_stack([np.asarray(column).astype(str) for column in columns])
+        self.header = None if header is None else np.asarray(header).astype(str)
+
+        rows, cols = self.data.shape
+        self.row_heights = np.zeros(rows)
+        self.col_widths = np.zeros(cols)
+        self.header_height = 0
+
+        # alignment of each column, 0: left, 1: center, 2: right, with margin between the text and the cell border
+        self.alignment = np.ones(cols, dtype=np.intp)
+        self.margin = 3
+
+        # optional (r, g, b) background color per row and per column, rows and columns with negative colors are not drawn
+        self.row_fills = None
+        self.col_fills = None
+
+        # (start, stop) range of the data rows drawn by set, None draws every row
+        self.window = None
+
+        self._rr = RectBatch(active=False)
+        self._cr = RectBatch(active=False)
+        self._header = self._batch(self.header_text)
+        self._header.active = header is not None
+        self._cells = self._batch(text)
+
+        self.addChild(self._rr)
+        self.addChild(self._cr)
+        self.addChild(self._header)
+        self.addChild(self._cells)
+
+    @staticmethod
+    def _batch(text: Text) -> TextBatch:
+        return TextBatch(font=text.font, size=text.size, baseline='central',
+                         fill=text.fill, fill_opacity=text.fill_opacity)
+
+    @property
+    def shape(self):
+        """
+        :return: (rows, columns) of the data, without the header
+        """
+        return self.data.shape
+
+    def set_row_height(self, height):
+        self.row_heights[:] = height
+        if self.header is not None:
+            self.header_height = height
+
+    def set_col_width(self, width):
+        self.col_widths[:] = width
+
+    def even_row_height(self, total_h):
+        """
+        Given the desired height, computes the row height for each row assuming all rows will have the same row height.
+
+        :param total_h: number representing the desired height of the table, including the header
+        """
+        self.set_row_height(total_h / (self.shape[0] + (self.header is not None)))
+
+    def even_col_width(self, total_w):
+        """
+        Given the desired width, computes the column width for each column
+        assuming all columns will have the same column width.
+
+        :param total_w: number representing the desired width of the table
+        """
+        self.set_col_width(total_w / self.shape[1])
+
+    def weighted_col_width(self, total_w: float, weights: list[float]):
+        """
+        Given the desired width and weights, computes the column width for each column.
+
+        :param total_w: number representing the desired width of the table
+        :param weights: list of percentages that define column widths
+        """
+        self.col_widths = total_w * np.asarray(weights, dtype=np.float64)
+
+    def weighted_row_width(self, total_h: float, weights: list[float]):
+        """
+        Given the desired height and weights, computes the row height for each row.
+
+        :param total_h: number representing the desired height of the table, without the header
+        :param weights: list of percentages that define row heights
+        """
+        self.row_heights = total_h * np.asarray(weights, dtype=np.float64)
+
+    def set_row_color(self, row: int, color: tuple[int, int, int]):
+        if self.row_fills is None:
+            self.row_fills = np.full((self.shape[0], 3), -1, dtype=np.int64)
+        self.row_fills[row] = color
+
+    def set_col_color(self, col: int, color: tuple[int, int, int]):
+        if self.col_fills is None:
+            self.col_fills = np.full((self.shape[1], 3), -1, dtype=np.int64)
+        self.col_fills[col] = color
+
+    def text_widths(self) -> np.ndarray:
+        """
+        Measures the text of every cell in one batched call
+
+        :return: array of shape (rows, columns) holding the rendered width of each cell's text
+        """
+        widths = self.text.font.measure_many(self.data.ravel().tolist(), self.text.size)
+        return widths.reshape(self.shape)
+
+    def auto_col_width(self, min_width: float = 0, max_width: float = None, padding: float = None,
+                       truncate: bool = False, ellipsis: str = '\u2026'):
+        """
+        Fits each column to the widest text it holds (header included), measured in one batched pass
+
+        :param min_width: smallest column width
+        :param max_width: largest column width, None for no limit
+        :param padding: room added on each side of the widest text, defaults to margin
+        :param truncate: shorten the text of cells that do not fit into max_width
+        :param ellipsis: appended to shortened text, see `Font.truncate`
+        """
+        padding = self.margin if padding is None else padding
+        widths = self.text_widths()
+        header = None
+        if self.header is not None:
+            t = self.header_text
+            header = t.font.measure_many(self.header.tolist(), t.size)
+
+        if truncate and max_width is not None:
+            room = max_width - 2 * padding
+
+            rows, cols = np.nonzero(widths > room)
+            if len(rows):
+                data = self.data.astype(object)
+                data[rows, cols] = self.text.font.truncate(data[rows, cols].tolist(), room, self.text.size, ellipsis)
+                self.data = data.astype(str)
+                widths = np.minimum(widths, room)
+
+            if header is not None and (header > room).any():
+                t = self.header_text
+                self.header = np.asarray(t.font.truncate(self.header.tolist(), room, t.size, ellipsis)).astype(str)
+                header = np.minimum(header, room)
+
+        widest = widths.max(axis=0, initial=0)
+        if header is not None:
+            widest = np.maximum(widest, header)
+
+        self.col_widths = np.clip(widest + 2 * padding, min_width, max_width)
+
+    def set_window(self, start: int, stop: int):
+        """
+        Draws only the data rows from start up to stop (e.g. a scroll viewport or a page) right below the header.
+        Layout and rendering only cost as much as the rows in the window.
+
+        :param start: first row to draw
+        :param stop: row after the last row to draw
+        """
+        self.window = (start, stop)
+        self.set()
+
+    def page_bounds(self, page_height: float) -> list[tuple[int, int]]:
+        """
+        Splits the data rows into pages that fit page_height together with the header.
+        A row higher than a page gets a page of its own.
+
+        :param page_height: available height per page
+        :return: (start, stop) row range of each page
+        """
+        return list(self._iter_page_bounds(page_height))
+
+    def _iter_page_bounds(self, page_height: float):
+        ends = np.cumsum(self.row_heights)
+        available = page_height - self.header_height
+
+        start = 0
+        while start < len(ends):
+            offset = ends[start - 1] if start else 0
+            stop = max(int(np.searchsorted(ends, offset + available, side='right')), start + 1)
+            yield start, stop
+            start = stop
+
+    def pages(self, page_height: float, **kwargs):
+        """
+        Splits the table into page Documents, each repeating the header.
+        Every page is laid out when it is requested, the table keeps its window afterwards.
+
+        :param page_height: height of a page
+        :param kwargs: further keyword arguments of the Document of each page
+        :return: generator yielding one Document per page
+        """
+        for start, stop in self._iter_page_bounds(page_height):
+            self.set_window(start, stop)
+
+            page = Document(w=self.w, h=page_height, **kwargs)
+            page.addChild(self.root.copy())
+            yield page
+
+    def set(self):
+        """
+        Positions the cells and backgrounds of the rows in the window
+        from the row heights, column widths and alignments
+        """
+        start, stop = (0, self.shape[0]) if self.window is None else self.window
+        data = self.data[start:stop]
+        row_fills = None if self.row_fills is None else self.row_fills[start:stop]
+
+        rows, cols = data.shape
+        heights, widths = self.row_heights[start:stop], self.col_widths
+
+        left = np.cumsum(widths) - widths
+        top = self.header_height + np.cumsum(heights) - heights
+        self.w = float(widths.sum())
+        self.h = float(self.header_height + heights.sum())
+
+        alignment = np.asarray(self.alignment)
+        x = np.where(alignment == 0, left + self.margin, np.where(alignment == 1, left + widths / 2,
+                                                                  left + widths - self.margin))
+        anchors = _ANCHORS[alignment]
+
+        cells = self._cells
+        cells.text = data.ravel()
+        cells.x = np.tile(x, rows)
+        cells.y = np.repeat(top + heights / 2, cols)
+        cells.anchor = np.tile(anchors, rows)
+
+        header = self._header
+        if self.header is not None:
+            header.text = self.header
+            header.x = x
+            header.y = self.header_height / 2
+            header.anchor = anchors
+
+        rr = self._rr
+        rr.active = False
+        if row_fills is not None:
+            drawn = (np.asarray(row_fills) >= 0).all(axis=1)
+            rr.x, rr.y, rr.w, rr.h, rr.fills = 0, top[drawn], self.w, heights[drawn], row_fills[drawn]
+            rr.active = bool(drawn.any())
+
+        cr = self._cr
+        cr.active = False
+        if self.col_fills is not None:
+            drawn = (np.asarray(self.col_fills) >= 0).all(axis=1)
+            cr.x, cr.y, cr.w, cr.h, cr.fills = left[drawn], 0, widths[drawn], self.h, self.col_fills[drawn]
+            cr.active = bool(drawn.any())
@@ -1,10 +1,68 @@
-from fontTools.ttLib import TTFont
 from base64 import b64encode
+from io import BytesIO
 from pathlib import Path
+from collections import OrderedDict
+from collections.abc import KeysView, ValuesView, ItemsView
+from threading import Lock
+from time import perf_counter
+from types import MethodType
+from array import array
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+# Layout of the precompiled metrics files written by Font.compile:
+# magic, version, units per em, .notdef width, reserved, number of widths, size of the source ttf file,
+# followed by one little endian uint16 advance width per codepoint from 0 up to the highest codepoint in the cmap
+# (MISSING where the cmap has no glyph)
+_MAGIC = b'PSVM'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHHHII')
+_MISSING = 0xFFFF
+
+
+def _fonts_dir():
+    return Path(__file__).resolve().parent / 'fonts'
+
+
+class _registry_get:
+    """
+    Font.get looks up the shared font of a family and weight on the class (see Font.get),
+    while font.get(key, default) on a font keeps working like dict.get
+    """
+
+    def __init__(self, function, method=dict.get):
+        self.function = function
+        self.method = method
+        self.__doc__ = function.__doc__
+
+    def instance(self, method):
+        return _registry_get(self.function, method)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return MethodType(self.function, owner)
+
+        return MethodType(self.method, instance)
 
 
 class Font(dict):
     # todo: add documentation
+
+    # process-wide registry of loaded fonts, see Font.get
+    max_fonts = 16
+    _registry = OrderedDict()
+    _registry_lock = Lock()
+    _stats = {'hits': 0, 'misses': 0, 'load_time': 0.0}
+
+    # process-wide cache of @font-face rules per (font file, codepoints), see Font.font_face
+    max_subsets = 64
+    _subsets = OrderedDict()
+    _subsets_lock = Lock()
+
     def __init__(self, family: str, weight: str):
         """
         This class is used by Text objects to define the fonts used by those objects.
@@ -17,28 +75,375 @@ class Font(dict):
         """
 
         file = weight + '.ttf'
-        path = Path(__file__).resolve().parent
-        path = path / 'fonts' / family / file
+        path = _fonts_dir() / family / file
         self.path = path
+        self.family = family
+        self.weight = weight
+        self._widths = None
+        self._codes = None
+        self._lut = None
+        self._base64 = None
+
+        super().__init__()
+        if not self._load_metrics(path.with_suffix('.metrics')):
+            self._load_ttf(path)
+
+    def _load_ttf(self, path: Path):
+        from fontTools.ttLib import TTFont
+
         font = TTFont(path)
         cmap = font['cmap'].getcmap(3, 1).cmap
         glyphs = font.getGlyphSet()
         self.units_per_em = font['head'].unitsPerEm
-        self.family = family
-        self.weight = weight
 
-        super().__init__({_ord: glyphs[_chr].width for _ord, _chr in cmap.items()})
-        self['.notdef'] = glyphs['.notdef']
+        self.update({_ord: glyphs[_chr].width for _ord, _chr in cmap.items()})
+        self['.notdef'] = glyphs['.notdef'].width
 
-    def __getitem__(self, item):
+    def _load_metrics(self, path: Path) -> bool:
+        """
+        Maps the precompiled metrics file of this font into memory.
+        Every process mapping the same file shares a single copy of it in the page cache.
+
+        :param path: location of the metrics file written by Font.compile
+        :return: False if the file is missing or out of date, in which case the TTF has to be parsed instead
+        """
         try:
-            return super().__getitem__(item)
-        except KeyError:
-            return super().__getitem__('.notdef')
+            with open(path, 'rb') as file:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+
+        if len(mm) < _HEADER.size:
+            mm.close()
+            return False
+
+        magic, version, units_per_em, notdef, _, count, size = _HEADER.unpack_from(mm)
+        if (magic != _MAGIC or version != _VERSION or len(mm) != _HEADER.size + 2 * count
+                or size != self.path.stat().st_size):
+            mm.close()
+            return False
+
+        view = memoryview(mm)[_HEADER.size:]
+        if sys.byteorder == 'little':
+            self._widths = view.cast('H')
+        else:
+            self._widths = array('H', view.tobytes())
+            self._widths.byteswap()
+
+        self.units_per_em = units_per_em
+        self['.notdef'] = notdef
+        return True
+
+    @staticmethod
+    def compile(family: str, weight: str) -> Path:
+        """
+        Compiles the cmap and advance widths of a font into a metrics file stored next to its TTF file.
+        Fonts created afterward memory map that file instead of parsing the TTF with fontTools.
+
+        :param family: font family, must match one of the folders in the fonts directory
+        :param weight: font weight, must match one of the TTF files in the family folder
+        :return: path of the written metrics file
+        """
+        from fontTools.ttLib import TTFont
+
+        path = _fonts_dir() / family / (weight + '.ttf')
+        font = TTFont(path)
+        cmap = font['cmap'].getcmap(3, 1).cmap
+        glyphs = font.getGlyphSet()
+
+        widths = array('H', [_MISSING]) * (max(cmap) + 1)
+        for _ord, _chr in cmap.items():
+            widths[_ord] = glyphs[_chr].width
+
+        if sys.byteorder != 'little':
+            widths.byteswap()
+
+        header = _HEADER.pack(_MAGIC, _VERSION, font['head'].unitsPerEm, glyphs['.notdef'].width, 0, len(widths),
+                              path.stat().st_size)
+
+        # write to a temporary file first so that processes mapping the old file never see a partial one
+        out = path.with_suffix('.metrics')
+        tmp = out.with_suffix('.metrics.tmp')
+        tmp.write_bytes(header + widths.tobytes())
+        os.replace(tmp, out)
+
+        return out
+
+    @staticmethod
+    def compile_all() -> list[Path]:
+        """
+        Compiles the metrics file of every font in the fonts directory.
+        The files are written next to the TTF files, i.e. into the fonts directory of the package itself.
+        Building the wheel runs this through the build hook in hatch_build.py, so installed wheels ship them.
+        Source checkouts and editable installs need to run it once themselves (with write access to the package),
+        e.g. `python -c "from PSVG import Font; Font.compile_all()"`, or keep parsing the TTF files.
+
+        :return: paths of the written metrics files
+        """
+        return [Font.compile(ttf.parent.name, ttf.stem) for ttf in sorted(_fonts_dir().glob('*/*.ttf'))]
+
+    @_registry_get
+    def get(cls, family: str, weight: str) -> 'Font':
+        """
+        Returns the shared Font for family and weight, loading the TTF file only the first time it is requested.
+        The registry keeps the max_fonts most recently used fonts and evicts the least recently used one beyond that.
+
+        :param family: string that defines the font family to use. Must match one of the folders in the fonts
+        directory
+        :param weight: Weight/Thickness of the font.
+        :return: Font object shared by every caller asking for the same family and weight
+        """
+        key = (family, weight)
+        with cls._registry_lock:
+            font = cls._registry.get(key)
+            if font is not None:
+                cls._registry.move_to_end(key)
+                cls._stats['hits'] += 1
+                return font
+
+            start = perf_counter()
+            font = cls(family, weight)
+            cls._stats['load_time'] += perf_counter() - start
+            cls._stats['misses'] += 1
+
+            cls._registry[key] = font
+            while len(cls._registry) > cls.max_fonts:
+                cls._registry.popitem(last=False)
+
+            return font
+
+    @get.instance
+    def get(self, key, default=None):
+        width = self._width(key)
+        return default if width is None else width
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        """
+        :return: dictionary with the registry's hits, misses, total load_time in seconds, current size and max_fonts
+        """
+        with cls._registry_lock:
+            return dict(cls._stats, size=len(cls._registry), max_fonts=cls.max_fonts)
+
+    @classmethod
+    def cache_clear(cls):
+        """
+        Empties the registry and resets its counters
+        """
+        with cls._registry_lock:
+            cls._registry.clear()
+            cls._stats.update(hits=0, misses=0, load_time=0.0)
+
+    def __getitem__(self, item):
+        width = self._width(item)
+        return super().__getitem__('.notdef') if width is None else width
+
+    def _width(self, item):
+        width = super().get(item)
+        if width is None and self._widths is not None and type(item) is int and 0 <= item < len(self._widths):
+            width = self._widths[item]
+            if width == _MISSING:
+                width = None
+
+        return width
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._lut = None
+
+    # Fonts loaded from a metrics file hold only .notdef and overridden widths in the dictionary itself,
+    # the methods below present the widths of the mapped file as entries as well,
+    # so that both kinds of fonts behave like the same mapping of codepoints to widths
+
+    def _mapped(self) -> np.ndarray:
+        """
+        :return: codepoints with a width in the metrics file (empty if the font was loaded from its TTF)
+        """
+        if self._codes is None:
+            widths = np.frombuffer(self._widths, dtype=np.uint16) if self._widths is not None else np.empty(0)
+            self._codes = np.flatnonzero(widths != _MISSING)
+
+        return self._codes
+
+    def __contains__(self, item):
+        return self._width(item) is not None
+
+    def __len__(self):
+        if self._widths is None:
+            return super().__len__()
+
+        own = [k for k in super().__iter__() if type(k) is int]
+        return super().__len__() + len(self._mapped()) - int(np.isin(own, self._mapped()).sum())
+
+    def __iter__(self):
+        yield from super().__iter__()
+        for code in self._mapped().tolist():
+            if not super().__contains__(code):
+                yield code
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def __reduce__(self):
+        # the memory mapped metrics are not picklable, other processes load the font through their own registry
+        return Font.get, (self.family, self.weight)
+
+    @property
+    def lut(self) -> np.ndarray:
+        """
+        Advance widths as an array indexed by codepoint.
+        The last entry holds the .notdef width and is used for every codepoint beyond the table.
+        Built on first use and rebuilt whenever a width is overridden through item assignment.
+        """
+        lut = self._lut
+        if lut is not None:
+            return lut
+
+        notdef = super().__getitem__('.notdef')
+        overrides = {k: v for k, v in dict.items(self) if type(k) is int and k >= 0}
+
+        size = max(len(self._widths) if self._widths is not None else 0, max(overrides, default=-1) + 1)
+        lut = np.full(size + 1, notdef, dtype=np.float64)
+
+        if self._widths is not None:
+            widths = np.frombuffer(self._widths, dtype=np.uint16)
+            lut[:len(widths)] = np.where(widths == _MISSING, notdef, widths)
+
+        if overrides:
+            lut[np.fromiter(overrides.keys(), dtype=np.intp)] = np.fromiter(overrides.values(), dtype=np.float64)
+
+        self._lut = lut
+        return lut
+
+    def measure_many(self, strings, size: float = 1) -> np.ndarray:
+        """
+        Measures the rendered width of many strings in one vectorized pass.
+        Characters without a glyph in this font are measured as .notdef.
+
+        :param strings: iterable of strings to measure
+        :param size: font size the strings are rendered at
+        :return: array with the width of each string in the same units as size
+        """
+        strings = strings if isinstance(strings, list) else list(strings)
+        lut = self.lut
+
+        lengths = np.fromiter(map(len, strings), dtype=np.intp, count=len(strings))
+        codes = np.frombuffer(''.join(strings).encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+        widths = lut[np.minimum(codes, len(lut) - 1)]
+
+        ends = np.cumsum(lengths)
+        totals = np.concatenate(([0.0], np.cumsum(widths)))
+        return (totals[ends] - totals[ends - lengths]) * size / self.units_per_em
+
+    def truncate(self, strings, width: float, size: float = 1, ellipsis: str = '\u2026') -> list[str]:
+        """
+        Shortens every string that is wider than width to its longest prefix that fits together with ellipsis.
+        All strings are measured and cut in one vectorized pass.
+
+        :param strings: iterable of strings
+        :param width: available width in the same units as size
+        :param size: font size the strings are rendered at
+        :param ellipsis: appended to every shortened string, '' cuts them off without a mark
+        :return: list with the strings, shortened where necessary
+        """
+        strings = strings if isinstance(strings, list) else list(strings)
+        lut = self.lut
+        scale = size / self.units_per_em
+
+        lengths = np.fromiter(map(len, strings), dtype=np.intp, count=len(strings))
+        codes = np.frombuffer(''.join(strings).encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+        totals = np.concatenate(([0.0], np.cumsum(lut[np.minimum(codes, len(lut) - 1)])))
+
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        over = np.flatnonzero((totals[ends] - totals[starts]) * scale > width)
+        if not len(over):
+            return strings
+
+        # longest prefix of each string whose width stays within the room left next to the ellipsis
+        room = (width - (self.measure(ellipsis, size) if ellipsis else 0)) / scale
+        stops = np.searchsorted(totals, totals[starts[over]] + room, side='right') - 1
+        keep = np.clip(stops, starts[over], ends[over]) - starts[over]
+
+        strings = strings.copy()
+        for i, n in zip(over.tolist(), keep.tolist()):
+            strings[i] = strings[i][:n] + ellipsis
+
+        return strings
+
+    def measure(self, string: str, size: float = 1) -> float:
+        """
+        :param string: text to measure
+        :param size: font size the text is rendered at
+        :return: rendered width of string in the same units as size
+        """
+        return float(self.measure_many([string], size)[0])
 
     def getBase64(self):
-        with open(self.path, 'rb') as file:
-            font = file.read()
+        if self._base64 is None:
+            with open(self.path, 'rb') as file:
+                font = file.read()
+
+            b64 = b64encode(font)
+            self._base64 = b64.decode('utf8')
+
+        return self._base64
+
+    def subset(self, codepoints) -> bytes:
+        """
+        Builds a copy of this font that only holds the glyphs needed for codepoints, using fontTools' subsetter
+
+        :param codepoints: iterable of the unicode codepoints to keep
+        :return: the subset as a WOFF file
+        """
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+
+        options = subset.Options()
+        options.drop_tables += ['meta']
+
+        font = TTFont(self.path)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+
+        font.flavor = 'woff'
+        buffer = BytesIO()
+        font.save(buffer)
+        return buffer.getvalue()
+
+    def font_face(self, codepoints=None) -> str:
+        """
+        CSS rule that embeds this font for the family and weight Text elements refer to.
+        Rules are cached per font file and set of codepoints, so that documents using the same characters share them.
+
+        :param codepoints: iterable of the unicode codepoints to embed glyphs for, None embeds the whole TTF file
+        :return: @font-face rule with the font as a base64 data url
+        """
+        key = (str(self.path), None if codepoints is None else frozenset(codepoints))
+        with Font._subsets_lock:
+            rule = Font._subsets.get(key)
+            if rule is not None:
+                Font._subsets.move_to_end(key)
+                return rule
+
+        if codepoints is None:
+            url, fmt = f'data:font/ttf;base64,{self.getBase64()}', 'truetype'
+        else:
+            url, fmt = f'data:font/woff;base64,{b64encode(self.subset(key[1])).decode("utf8")}', 'woff'
+
+        rule = f'@font-face{{font-family:"{self.family}";font-weight:{self.weight};src:url({url}) format("{fmt}")}}'
+
+        with Font._subsets_lock:
+            rule = Font._subsets.setdefault(key, rule)
+            while len(Font._subsets) > Font.max_subsets:
+                Font._subsets.popitem(last=False)
+
+        return rule
 
-        b64 = b64encode(font)
-        return b64.decode('utf8')
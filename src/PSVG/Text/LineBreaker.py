@@ -0,0 +1,87 @@
+from bisect import bisect_right
+
+import numpy as np
+
+
+class LineBreaker:
+    """
+    Splits a sequence of measured words into lines that fit a given width.
+
+    All line widths are read off prefix sums of the word widths, so no line is ever re-joined or re-measured
+    while breaking. Both modes yield (beg, end) word ranges, one per line, so that words[beg:end] is a line.
+
+    - greedy: puts as many words on each line as fit, line by line. Linear and fully lazy.
+    - balanced: minimizes the squared slack of every line but the last (minimum raggedness).
+      Needs one dynamic programming pass over the words before the first line is yielded.
+
+    A word wider than the line width always gets a line of its own.
+    """
+
+    def __init__(self, widths, space: float, width: float):
+        """
+        :param widths: rendered width of each word
+        :param space: rendered width of the space between two words
+        :param width: maximum width of a line
+        """
+        widths = np.asarray(widths, dtype=np.float64)
+
+        self.space = space
+        self.width = width
+        self.count = len(widths)
+
+        # ends[i] is the width of the first i words, each followed by a space
+        self._ends = np.concatenate(([0.0], np.cumsum(widths + space)))
+
+    def line_width(self, beg: int, end: int) -> float:
+        """
+        :return: rendered width of the line holding words[beg:end]
+        """
+        return float(self._ends[end] - self._ends[beg]) - self.space
+
+    def greedy(self):
+        """
+        Lazily breaks the words into lines, filling each line before starting the next one.
+
+        :return: generator of (beg, end) word ranges
+        """
+        ends = self._ends.tolist()
+        limit = self.width + self.space + 1e-9
+
+        beg = 0
+        while beg < self.count:
+            end = max(bisect_right(ends, ends[beg] + limit, beg) - 1, beg + 1)
+            yield beg, end
+            beg = end
+
+    def balanced(self):
+        """
+        Breaks the words into lines with the least total squared slack, the last line being free.
+
+        :return: generator of (beg, end) word ranges
+        """
+        ends = self._ends
+        count = self.count
+        limit = self.width + self.space + 1e-9
+
+        cost = np.zeros(count + 1)
+        breaks = np.zeros(count + 1, dtype=np.intp)
+        last = np.searchsorted(ends, ends + limit, side='right') - 1
+
+        for beg in range(count - 1, -1, -1):
+            stop = min(max(last[beg], beg + 1), count)
+            candidates = np.arange(beg + 1, stop + 1)
+
+            slack = self.width - (ends[candidates] - ends[beg] - self.space)
+            total = slack * slack + cost[candidates]
+            if candidates[-1] == count:
+                total[-1] = 0
+
+            best = int(np.argmin(total))
+            cost[beg] = total[best]
+            breaks[beg] = candidates[best]
+
+        beg = 0
+        while beg < count:
+            end = int(breaks[beg])
+            yield beg, end
+            beg = end
@@ -1,15 +1,20 @@
 from ..Text import Text
+from .LineBreaker import LineBreaker
 from ..SVG import Section
 from ..Draw import Rect
 
 
 class Paragraph(Section):
     # todo: add documentation
-    def __init__(self, text: Text, w: float, h: float, x: float = 0, y: float = 0):
+    def __init__(self, text: Text, w: float, h: float, x: float = 0, y: float = 0, mode: str = 'greedy'):
+        """
+        :param mode: line breaking strategy, 'greedy' or 'balanced' (see `LineBreaker`)
+        """
         super().__init__(x, y, w, h)
 
         self.linewidth = 0
         self.indention = 4
+        self.mode = mode
         self.text = text
         self.text.baseline = 'central'
 
@@ -22,42 +27,37 @@ class Paragraph(Section):
         self._get_lines()
 
     def _get_lines(self):
-        t = self.text
-        t.font[ord('\t')] = t.font[ord(' ')] * self.indention
+        self.lines = list(self.iter_lines())
 
-        self.lines = [self.sublines(line) for line in t.text.split('\n')]
+    def iter_lines(self):
+        """
+        Lazily breaks the paragraph text into lines that fit the paragraph width
 
-    def sublines(self, text: str):
+        :return: generator of line strings in order
+        """
+        for text in str(self.text.text).split('\n'):
+            yield from self.iter_sublines(text)
+
+    def iter_sublines(self, text: str):
+        """
+        Lazily breaks a single line of text (no newlines) into lines that fit the paragraph width
+
+        :param text: the text to break
+        :return: generator of line strings in order
+        """
         t = self.text
-        lines = []
-        words = text.split(' ')
-        wlens = [sum([t.font[ord(letter)] for letter in word]) * t.size / t.font.units_per_em for word in words]
+        tab = ' ' * self.indention
+        words = [word.replace('\t', tab) for word in text.split(' ')]
+
         space = t.font[ord(' ')] * t.size / t.font.units_per_em
+        breaker = LineBreaker(t.font.measure_many(words, t.size), space, self.w)
+        ranges = breaker.balanced() if self.mode == 'balanced' else breaker.greedy()
+
+        for beg, end in ranges:
+            yield ' '.join(words[beg:end])
 
-        s = 0
-        beg = 0
-        for i, word in enumerate(words):
-            pos = s + space + wlens[i]
-            if pos > self.w:
-                line = ' '.join(words[beg:i])
-                line = line.replace('\t', ' ' * self.indention)
-                lines.append(line)
-                beg = i
-                s = 0
-            elif pos == self.w:
-                line = ' '.join(words[beg:i + 1])
-                line = line.replace('\t', ' ' * self.indention)
-                lines.append(line)
-                beg = i + 1
-                s = 0
-            else:
-                if i == len(words) - 1:
-                    line = ' '.join(words[beg:])
-                    line = line.replace('\t', ' ' * self.indention)
-                    lines.append(line)
-                s = pos
-
-        return lines
+    def sublines(self, text: str):
+        return list(self.iter_sublines(text))
 
     def set(self):
         if self.h == 0:
@@ -1,3 +1,7 @@
+from itertools import accumulate
+
+import numpy as np
+
 from .Text import Text
 from ..Draw import Rect
 from ..SVG import Section
@@ -18,6 +22,10 @@ class Table(Section):
         self._rr = [Rect(active=False) for _ in self.r_rng]
         self._cr = [Rect(active=False) for _ in self.c_rng]
 
+        # row heights, column widths and offsets of the last layout (see set) and boxes added since then
+        self._layout = None
+        self._new = set()
+
         _ = [self.addChild(self._rr[i]) for i in self.r_rng]
         _ = [self.addChild(self._cr[i]) for i in self.c_rng]
 
@@ -54,6 +62,30 @@ class Table(Section):
 
         self.boxes[row, col] = TextBox(text)
         self.addChild(self.boxes[row, col].root)
+        self._new.add((row, col))
+
+    def set_value(self, row, col, value):
+        """
+        Changes the text of a box. The layout of a box does not depend on its text,
+        so this needs no call to set and only the changed box is rendered again.
+
+        :param row: Integer represent the row of the box
+        :param col: Integer representing the column of the box
+        :param value: The new text value of the box
+        """
+        self.boxes[row, col].text.text = str(value)
+
+    def set_row(self, row: int, height: float):
+        """
+        Changes the height of a single row, the next call of set only moves the rows below it
+        """
+        self._rows[row] = height
+
+    def set_col(self, col: int, width: float):
+        """
+        Changes the width of a single column, the next call of set only moves the columns right of it
+        """
+        self._cols[col] = width
 
     def set_row_height(self, height):
         for i in self.r_rng:
@@ -137,6 +169,56 @@ class Table(Section):
                 x += w
             y += h
 
+    def text_widths(self) -> np.ndarray:
+        """
+        Measures the text of every cell. Cells sharing a font and size are measured in one batched call.
+
+        :return: array of shape (rows, columns) holding the rendered width of each cell's text
+        """
+        widths = np.zeros((len(self.rows), len(self.cols)))
+        groups = {}
+        for (row, col), box in self.boxes.items():
+            t = box.text
+            font, size, cells, strings = groups.setdefault((id(t.font), t.size), (t.font, t.size, [], []))
+            cells.append((row, col))
+            strings.append(str(t.text))
+
+        for font, size, cells, strings in groups.values():
+            rows, cols = zip(*cells)
+            widths[list(rows), list(cols)] = font.measure_many(strings, size)
+
+        return widths
+
+    def auto_col_width(self, min_width: float = 0, max_width: float = None, padding: float = 0,
+                       truncate: bool = False, ellipsis: str = '\u2026'):
+        """
+        Fits each column to the widest text it holds, measured with the font of each cell in one batched pass
+
+        :param min_width: smallest column width
+        :param max_width: largest column width, None for no limit
+        :param padding: room added on each side of the widest text
+        :param truncate: shorten the text of cells that do not fit into max_width
+        :param ellipsis: appended to shortened text, see `Font.truncate`
+        """
+        widths = self.text_widths()
+
+        if truncate and max_width is not None:
+            room = max_width - 2 * padding
+            groups = {}
+            for row, col in zip(*np.nonzero(widths > room)):
+                t = self.boxes[row, col].text
+                groups.setdefault((id(t.font), t.size), (t.font, t.size, []))[2].append(t)
+
+            for font, size, texts in groups.values():
+                for t, s in zip(texts, font.truncate([str(t.text) for t in texts], room, size, ellipsis)):
+                    t.text = s
+
+            widths = np.minimum(widths, room)
+
+        cols = np.clip(widths.max(axis=0, initial=0) + 2 * padding, min_width, max_width)
+        self._cols = cols.tolist()
+        self.w = sum(self._cols)
+
     def set_box_text(self, row: int, col: int, to_copy: Text):
         t = self.boxes[row, col].text
         t.fill = to_copy.fill
@@ -169,9 +251,57 @@ class Table(Section):
         self.set_rect_color(self._cr[col], color, opacity)
 
     def set(self):
-        self.set_sizes()
-        for box in self.boxes.values():
-            box.set()
+        """
+        Lays out the table. After the first call only the rows and columns whose size or offset changed since the
+        previous call are moved, together with boxes added in between, and only boxes whose geometry, alignment or
+        margin changed are laid out again.
+        """
+        rows, cols = list(self._rows), list(self._cols)
+        # offsets summed up the same way as in set_sizes, so that both write the same numbers
+        ys = list(accumulate(rows[:-1], initial=0)) if rows else []
+        xs = list(accumulate(cols[:-1], initial=0)) if cols else []
+
+        layout = self._layout
+        if layout is None or len(layout[0]) != len(rows) or len(layout[1]) != len(cols):
+            self.set_sizes()
+            for box in self.boxes.values():
+                box.set()
+
+        else:
+            old_rows, old_cols, old_ys, old_xs = layout
+            moved_rows = [i for i in self.r_rng if rows[i] != old_rows[i] or ys[i] != old_ys[i]]
+            moved_cols = [j for j in self.c_rng if cols[j] != old_cols[j] or xs[j] != old_xs[j]]
+
+            # the sizing methods already assign w and h, so the totals are compared with those of the last layout
+            w, h = sum(cols), sum(rows)
+            self.w = w
+            self.h = h
+
+            # row backgrounds span the width of the table, column backgrounds its height
+            for i in (self.r_rng if w != sum(old_cols) else moved_rows):
+                rect = self._rr[i]
+                rect.y = ys[i]
+                rect.h = rows[i]
+                rect.w = w
+
+            for j in (self.c_rng if h != sum(old_rows) else moved_cols):
+                rect = self._cr[j]
+                rect.x = xs[j]
+                rect.h = h
+                rect.w = cols[j]
+
+            cells = {(i, j) for i in moved_rows for j in self.c_rng}
+            cells.update((i, j) for i in self.r_rng for j in moved_cols)
+            cells.update(self._new)
+            for i, j in cells:
+                self.boxes[i, j].xywh = (xs[j], ys[i], cols[j], rows[i])
+
+            # alignment and margin can change in any box, boxes whose geometry did not change skip the work
+            for box in self.boxes.values():
+                box.set()
+
+        self._layout = (rows, cols, ys, xs)
+        self._new = set()
 
 
 class TextBox(Section):
@@ -189,6 +319,7 @@ class TextBox(Section):
         self.addChild(self.text)
 
         self.alignment = self.right
+        self._geometry = None
 
     def center(self):
         self.text.x = self.w / 2
@@ -210,4 +341,8 @@ class TextBox(Section):
         self.text.baseline = 'central'
 
     def set(self):
-        self.alignment()
+        # the alignment only depends on the geometry of the box, which is compared against the previous call
+        geometry = (self.w, self.h, self.margin, self.alignment)
+        if geometry != self._geometry:
+            self.alignment()
+            self._geometry = geometry
@@ -1,8 +1,11 @@
 from ..Draw.Base import Base
+from ..Render import DEFAULT
 
 
 class Text(Base):
     # todo: add documentation
+    __slots__ = ('text', 'x', 'y', 'angle', 'font', 'size', 'baseline', 'anchor')
+
     def __init__(self, font, text='', size=10, x=0, y=0, angle=0, baseline=None, anchor=None, **kwargs):
         super().__init__('text', **kwargs)
         self.text = text
@@ -22,52 +25,50 @@ class Text(Base):
         # options
         # 'start', 'middle', 'end'
 
-    def _validate(self):
-        super(Text, self)._validate()
+    def _validate(self, options=DEFAULT):
+        valid = super(Text, self)._validate(options)
         s = super(Text, self)._get_string_value
 
         if self.angle != 0:
             # x ########################################################################################################
-            self.valid['x'] = s(0, 'x')
+            valid['x'] = s(0, 'x', options)
 
             # y ########################################################################################################
-            self.valid['y'] = s(0, 'y')
+            valid['y'] = s(0, 'y', options)
 
             # angle ####################################################################################################
-            self.valid['transform'] = f'transform = "translate({self.x}, {self.y}) rotate({self.angle})"'
+            x, y, angle = options.num(self.x), options.num(self.y), options.num(self.angle)
+            valid['transform'] = f'transform = "translate({x}, {y}) rotate({angle})"'
         else:
             # x ########################################################################################################
-            self.valid['x'] = s(self.x, 'x')
+            valid['x'] = s(self.x, 'x', options)
 
             # y ########################################################################################################
-            self.valid['y'] = s(self.y, 'y')
+            valid['y'] = s(self.y, 'y', options)
 
         # font size ####################################################################################################
-        self.valid['size'] = s(self.size, 'font-size')
+        valid['size'] = s(self.size, 'font-size', options)
 
         # font weight ##################################################################################################
-        self.valid['weight'] = s(self.font.weight, 'font-weight')
+        valid['weight'] = s(self.font.weight, 'font-weight', options)
 
         # font family ##################################################################################################
-        self.valid['family'] = s(self.font.family, 'font-family')
+        valid['family'] = s(self.font.family, 'font-family', options)
 
         # baseline #####################################################################################################
-        self.valid['dominant baseline'] = s(self.baseline, 'dominant-baseline')
+        valid['dominant baseline'] = s(self.baseline, 'dominant-baseline', options)
 
         # anchor #######################################################################################################
-        self.valid['text-anchor'] = s(self.anchor, 'text-anchor')
+        valid['text-anchor'] = s(self.anchor, 'text-anchor', options)
 
         # preserve spaces ##############################################################################################
-        self.valid['xml:space'] = s('preserve', 'xml:space')
+        valid['xml:space'] = s('preserve', 'xml:space', options)
 
-    def construct(self, depth):
-        if self.active is False:
-            return ''
+        return valid
 
-        tab = '   ' * depth
-        self._validate()
-        s = ' '.join([i for i in self.valid.values() if i is not None])
-        return f'{tab}<text {s}>{self.text}</text>'
+    def _render(self, options=DEFAULT):
+        s = ' '.join([i for i in self._attributes(options).values() if i is not None])
+        return f'<text {s}>{self.text}</text>'
 
     def copy(self, item: 'Text' = None):
         item = super().copy(Text(self.font)) if item is None else super().copy(item)
@@ -85,4 +86,4 @@ class Text(Base):
 
     @property
     def width(self):
-        return sum([self.font[ord(letter)] for letter in self.text]) * self.font.unit_per_em
+        return self.font.measure(str(self.text), self.size)
@@ -0,0 +1,83 @@
+import numpy as np
+
+from ..Draw.Batch import Batch
+from ..Render import RenderOptions, DEFAULT
+
+
+class TextBatch(Batch):
+    """
+    Concrete Implementation of `Draw.Batch`
+
+    Draws one text element per entry of text, x and y, which are broadcast against each other, all in one font.
+    size, baseline and anchor can be given per element as well.
+    """
+    __slots__ = ('text', 'x', 'y', 'font', 'size', 'baseline', 'anchor')
+
+    _columns = (('x', 'x'), ('y', 'y'), ('size', 'font-size'), ('baseline', 'dominant-baseline'),
+                ('anchor', 'text-anchor'))
+
+    def __init__(self, font=None, text='', x=0, y=0, size=10, baseline=None, anchor=None, **kwargs):
+        """
+        :param font: Font shared by all elements
+        :param text: strings to draw
+        :param x: x coordinates of the strings
+        :param y: y coordinates of the strings
+        :param size: font sizes
+        :param baseline: optional dominant baselines, see `Text.Text`
+        :param anchor: optional text anchors ('start', 'middle', 'end')
+        :param fills: optional (n, 3) array of (r, g, b) fill colors, one per string
+        """
+        super().__init__(name='text batch', **kwargs)
+        self.type = 'text'
+
+        self.text = text
+        self.x = x
+        self.y = y
+        self.font = font
+        self.size = size
+        self.baseline = baseline
+        self.anchor = anchor
+
+    @property
+    def count(self):
+        shape = np.broadcast_shapes((super().count,), np.shape(self.text))
+        return shape[0] if shape else 1
+
+    def _validate(self, options: RenderOptions = DEFAULT):
+        valid = super(TextBatch, self)._validate(options)
+        s = super(TextBatch, self)._get_string_value
+
+        # font weight ##################################################################################################
+        valid['weight'] = s(self.font.weight, 'font-weight', options)
+
+        # font family ##################################################################################################
+        valid['family'] = s(self.font.family, 'font-family', options)
+
+        # preserve spaces ##############################################################################################
+        valid['xml:space'] = s('preserve', 'xml:space', options)
+
+        return valid
+
+    def _template(self, attributes: str) -> str:
+        return f'<{self.type} {attributes}>%s</{self.type}>'
+
+    def _contents(self, count) -> list:
+        text = np.broadcast_to(np.asarray(self.text, dtype=object), (count,))
+        return [[str(i) for i in text.tolist()]]
+
+    @property
+    def widths(self) -> np.ndarray:
+        """
+        :return: rendered width of every string
+        """
+        count = self.count
+        text = np.broadcast_to(np.asarray(self.text, dtype=object), (count,))
+        sizes = np.broadcast_to(np.asarray(self.size, dtype=np.float64), (count,))
+        return self.font.measure_many([str(i) for i in text.tolist()]) * sizes
+
+    def copy(self, item: 'TextBatch' = None):
+        item = super().copy(TextBatch() if item is None else item)
+        item.text = self.text
+        item.font = self.font
+
+        return item
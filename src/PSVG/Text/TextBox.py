@@ -22,6 +22,9 @@ class TextBox(Section):
 
         self.alignment = alignment
 
+        # geometry the text was last aligned for, see set
+        self._geometry = None
+
     def _horizontal(self):
         t = self._text
         x = self.alignment[0]
@@ -55,8 +58,12 @@ class TextBox(Section):
             t.baseline = 'auto'
 
     def set(self):
-        self._horizontal()
-        self._vertical()
+        # the alignment only depends on the geometry of the box, which is compared against the previous call
+        geometry = (self.w, self.h, self.alignment, self.dL, self.dB, self.dR, self.dT)
+        if geometry != self._geometry:
+            self._horizontal()
+            self._vertical()
+            self._geometry = geometry
 
     @property
     def text(self):
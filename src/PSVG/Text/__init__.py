@@ -3,3 +3,6 @@ from .TextBox import TextBox
 from .Paragraph import Paragraph
 from .Font import Font
 from .Table import Table
+from .LineBreaker import LineBreaker
+from .TextBatch import TextBatch
+from .FlatTable import FlatTable
@@ -1,4 +1,5 @@
-from .Text import Text, Font, Paragraph, Table, TextBox
-from .SVG import SVG, Section, G, Document, Tree
-from .Draw import Rect, Base, Circle, Path
+from .Text import Text, Font, Paragraph, Table, TextBox, LineBreaker, TextBatch, FlatTable
+from .SVG import SVG, Section, G, Defs, Symbol, Document, Tree, Template, render_many
+from .Draw import Rect, Base, Circle, Path, CircleBatch, RectBatch, Use
 from .Data_Structures import Node, Graph, Edge
+from .Render import RenderOptions
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from PSVG import G, Circle, Rect
+from PSVG.Draw.Batch import CircleBatch, RectBatch
+from PSVG.Render import RenderOptions
+
+
+def one_by_one(shapes, options):
+    g = G()
+    for shape in shapes:
+        g.add_child(shape)
+
+    return g.construct(0, options)
+
+
+def batched(batch, options):
+    g = G()
+    g.add_child(batch)
+    return g.construct(0, options)
+
+
+OPTIONS = [RenderOptions(), RenderOptions(precision=1), RenderOptions(minify=True)]
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+@pytest.mark.parametrize('cx', [[0.5, 1, 2.25], np.array([0.5, 1.0, 2.25]), [1, 2, 3], (3, 2.5, 7)])
+def test_circle_batch_matches_circles(cx, options):
+    cy = [4, 5.75, 6]
+    fills = [(1, 2, 3), (4, 5, 6), (7, 8, 9)]
+
+    circles = [Circle(cx[i], cy[i], 2, fill=fills[i], stroke=(0, 0, 0)) for i in range(3)]
+    batch = CircleBatch(cx=cx, cy=cy, r=2, fills=fills, stroke=(0, 0, 0))
+
+    assert batched(batch, options) == one_by_one(circles, options)
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+def test_rect_batch_matches_rects(options):
+    x, y, w = [0, 1.5, 2], np.array([1.25, 2.0, 3.0]), [10, 20.5, 30]
+
+    rects = [Rect(x[i], y[i], w[i], 4, fill=(9, 9, 9), fill_opacity=0.5) for i in range(3)]
+    batch = RectBatch(x=x, y=y, w=w, h=4, fill=(9, 9, 9), fill_opacity=0.5)
+
+    assert batched(batch, options) == one_by_one(rects, options)
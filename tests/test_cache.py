@@ -0,0 +1,58 @@
+from PSVG import Document, Circle, Path, Rect
+
+
+def test_assignment_invalidates_cached_output():
+    d = Document(w=100, h=100)
+    r = Rect(1, 2, 3, 4)
+    d.addChild(r)
+    d.construct(cache=True)
+
+    r.fill = (1, 2, 3)
+    r.w = 7
+    out = d.construct(cache=True)
+    assert 'fill="#010203"' in out and 'width="7"' in out
+    assert out == d.construct()
+
+
+def test_cached_output_is_reused():
+    d = Document(w=100, h=100)
+    c = Circle(1, 2, 3)
+    d.addChild(c)
+    d.construct(cache=True)
+
+    rendered = c._cache[2]
+    d.construct(cache=True)
+    assert c._cache[2] is rendered
+
+
+def test_in_place_changes_need_touch():
+    d = Document(w=100, h=100)
+    p = Path([('M', 0, 0), ('L', 1, 1)])
+    d.addChild(p)
+    d.construct(cache=True)
+
+    p.points.append(('L', 5, 5))
+    assert 'L 5 5' not in d.construct(cache=True)
+
+    p.touch()
+    assert 'L 5 5' in d.construct(cache=True)
+
+
+def test_without_cache_output_is_never_stale():
+    d = Document(w=100, h=100)
+    p = Path([('M', 0, 0), ('L', 1, 1)])
+    d.addChild(p)
+    d.construct(cache=True)
+
+    p.points.append(('L', 5, 5))
+    assert 'L 5 5' in d.construct()
+
+
+def test_options_key_selects_the_output():
+    d = Document(w=100, h=100)
+    d.addChild(Circle(1.234, 2, 3))
+
+    assert 'cx="1.234"' in d.construct(cache=True)
+    assert 'cx="1.2"' in d.construct(cache=True, precision=1)
+    assert d.construct(cache=True, minify=True) == d.construct(minify=True)
+    assert 'cx="1.234"' in d.construct(cache=True)
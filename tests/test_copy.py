@@ -0,0 +1,71 @@
+from PSVG import Document, Section, Circle, Font, Text
+
+
+def build():
+    text = Text(Font.get('Arial', '400'), 'orig')
+    s = Section(1, 2, 50, 50)
+    s.addChild(text)
+    s.addChild(Circle(1, 2, 3))
+
+    d = Document(w=100, h=100)
+    d.addSection(s)
+    return d, s, text
+
+
+def leaves(node):
+    stack, found = [node], []
+    while stack:
+        node = stack.pop()
+        found.append(node)
+        stack.extend(node.edges)
+
+    return [node for node in found if not node.edges]
+
+
+def test_changing_a_copy_leaves_the_template_alone():
+    for make_copy in (Document.copy, Document.share):
+        d, _, _ = build()
+        before = d.construct()
+
+        c = make_copy(d)
+        text = next(node for node in leaves(c.root) if isinstance(node, Text))
+        text.text = 'CHANGED'
+        c.addChild(Circle(9, 9, 9))
+
+        assert 'CHANGED' in c.construct() and 'cx="9"' in c.construct()
+        assert d.construct() == before
+
+
+def test_changing_the_template_leaves_copies_alone():
+    d, s, text = build()
+    c = d.copy()
+    before = c.construct()
+
+    text.text = 'CHANGED'
+    s.x = 70
+    d.addChild(Circle(9, 9, 9))
+
+    assert 'CHANGED' in d.construct()
+    assert c.construct() == before
+
+
+def test_share_is_lazy():
+    d, _, _ = build()
+    c = d.share()
+
+    # the copy borrows the children of the template until they are reached through its edges
+    assert c.root._shared and c.root._edges is d.root._edges
+    assert c.construct() == d.construct()
+
+
+def test_section_copies():
+    _, s, _ = build()
+    before = s.root.construct(0)
+    for make_copy in (Section.copy, Section.share):
+        c = make_copy(s)
+        c.w = 10
+        c.addChild(Circle(5, 5, 5))
+
+        assert c.svg in c.root.edges
+        assert 'width="10"' in c.root.construct(0) and 'cx="5"' in c.root.construct(0)
+        assert s.root.construct(0) == before
@@ -0,0 +1,45 @@
+import pytest
+
+from PSVG import Document, Section, Circle, Rect, Use
+
+
+def test_define_and_use_output():
+    d = Document(w=10, h=10)
+    d.addChild(Rect(0, 0, 1, 1))
+    marker = d.define(Circle(1, 2, 3))
+    d.addChild(Use(marker, 5, 6))
+    d.addChild(Use(marker, 1, 2, angle=90, scale=2, fill=(1, 2, 3)))
+
+    assert marker == 'd0'
+    assert d.construct(minify=True) == (
+        '<svg width="10" height="10" xmlns="http://www.w3.org/2000/svg">'
+        '<defs><g id="d0"><circle cx="1" cy="2" r="3"/></g></defs>'
+        '<rect x="0" y="0" width="1" height="1"/>'
+        '<use href="#d0" x="5" y="6"/>'
+        '<use fill="#010203" href="#d0" transform="translate(1 2) rotate(90) scale(2)"/>'
+        '</svg>')
+
+
+def test_define_section():
+    d = Document(w=10, h=10)
+    s = Section(0, 0, 5, 5)
+    s.addChild(Circle(0, 0, 1))
+
+    assert d.define(s, 'legend') == 'legend'
+    assert '<g id="legend">' in d.construct()
+
+
+def test_generated_ids_skip_given_ids():
+    d = Document(w=10, h=10)
+    ids = [d.define(Circle(0, 0, 1), 'd1'), d.define(Rect()), d.define(Rect(), 'd3'), d.define(Rect())]
+
+    assert len(set(ids)) == 4
+    assert sum(f'<g id="{i}">' in d.construct() for i in ids) == 4
+
+
+def test_duplicate_ids_are_rejected():
+    d = Document(w=10, h=10)
+    d.define(Circle(0, 0, 1), 'marker')
+
+    with pytest.raises(ValueError):
+        d.define(Rect(), 'marker')
@@ -0,0 +1,66 @@
+import importlib
+import shutil
+
+import pytest
+
+from PSVG import Document, FlatTable, Font, Text
+
+# the module, PSVG.Text.Font itself is the class exported by the package
+FontModule = importlib.import_module('PSVG.Text.Font')
+
+
+def test_embedded_fonts_cover_every_row_of_a_flat_table():
+    font = Font.get('Arial', '400')
+    rows = ['a'] * 3000
+    rows[1500] = 'Ω'
+
+    d = Document(w=100, h=100)
+    table = FlatTable(Text(font, ''), [rows])
+    table.set()
+    d.addSection(table)
+
+    assert font.font_face({ord('a'), ord('Ω')}) in d.construct(embed_fonts=True)
+
+
+@pytest.fixture
+def fonts_dir(tmp_path, monkeypatch):
+    # a copy of one font family, so that compiled metrics files do not end up in the package
+    (tmp_path / 'Arial').mkdir()
+    shutil.copy(FontModule._fonts_dir() / 'Arial' / '400.ttf', tmp_path / 'Arial' / '400.ttf')
+    monkeypatch.setattr(FontModule, '_fonts_dir', lambda: tmp_path)
+    return tmp_path
+
+
+def test_mapped_font_matches_parsed_font(fonts_dir):
+    parsed = Font('Arial', '400')
+    assert Font.compile('Arial', '400') == fonts_dir / 'Arial' / '400.metrics'
+
+    mapped = Font('Arial', '400')
+    assert mapped._widths is not None and parsed._widths is None
+
+    assert len(mapped) == len(parsed)
+    assert set(mapped) == set(parsed)
+    assert dict(mapped.items()) == dict(parsed.items())
+    assert ord('a') in mapped and 'a' not in mapped
+    assert mapped.get(ord('a')) == parsed.get(ord('a')) == parsed[ord('a')]
+    assert mapped.get(0x10FFFF, -1) == -1 and mapped[0x10FFFF] == parsed['.notdef']
+    assert mapped.measure('Hello Ω') == parsed.measure('Hello Ω')
+
+    mapped[ord('a')] = 5
+    assert len(mapped) == len(parsed) and mapped.get(ord('a')) == 5 and mapped.measure('a') == 5 / 2048
+
+
+@pytest.mark.parametrize('content', [b'', b'PSVM', b'XXXX' + bytes(40)])
+def test_broken_metrics_fall_back_to_the_ttf(fonts_dir, content):
+    (fonts_dir / 'Arial' / '400.metrics').write_bytes(content)
+
+    font = Font('Arial', '400')
+    assert font._widths is None and font[ord('a')] == 1139
+
+
+def test_outdated_metrics_fall_back_to_the_ttf(fonts_dir):
+    Font.compile('Arial', '400')
+    with open(fonts_dir / 'Arial' / '400.ttf', 'ab') as ttf:
+        ttf.write(b'\0')
+
+    assert Font('Arial', '400')._widths is None
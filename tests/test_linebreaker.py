@@ -0,0 +1,85 @@
+import itertools
+import random
+
+from PSVG import Font, Paragraph, Text
+from PSVG.Text.LineBreaker import LineBreaker
+
+
+def naive_greedy(widths, space, width):
+    # fills each line word by word, a word that does not fit starts the next line
+    lines, beg, used = [], 0, None
+    for i, w in enumerate(widths):
+        if used is not None and used + space + w <= width:
+            used += space + w
+            continue
+
+        if used is not None:
+            lines.append((beg, i))
+        beg, used = i, w
+
+    if used is not None:
+        lines.append((beg, len(widths)))
+
+    return lines
+
+
+def raggedness(breaker, lines):
+    return sum((breaker.width - breaker.line_width(beg, end)) ** 2 for beg, end in lines[:-1])
+
+
+def naive_balanced(breaker):
+    # tries every way of breaking the words into lines that fit (or hold a single word)
+    best = None
+    for cuts in itertools.product((False, True), repeat=breaker.count - 1):
+        bounds = [0] + [i + 1 for i, cut in enumerate(cuts) if cut] + [breaker.count]
+        lines = list(zip(bounds, bounds[1:]))
+        if all(end - beg == 1 or breaker.line_width(beg, end) <= breaker.width for beg, end in lines):
+            cost = raggedness(breaker, lines)
+            best = cost if best is None else min(best, cost)
+
+    return best
+
+
+def random_words(rng, count):
+    return [rng.randint(1, 40) for _ in range(count)], rng.randint(1, 5), rng.randint(20, 120)
+
+
+def test_greedy_matches_naive_reference():
+    rng = random.Random(6)
+    for _ in range(500):
+        widths, space, width = random_words(rng, rng.randint(0, 60))
+        assert list(LineBreaker(widths, space, width).greedy()) == naive_greedy(widths, space, width)
+
+
+def test_balanced_is_optimal():
+    rng = random.Random(7)
+    for _ in range(200):
+        widths, space, width = random_words(rng, rng.randint(1, 12))
+        breaker = LineBreaker(widths, space, width)
+        lines = list(breaker.balanced())
+
+        # the lines cover all words in order
+        assert lines[0][0] == 0 and lines[-1][1] == len(widths)
+        assert all(a[1] == b[0] for a, b in zip(lines, lines[1:]))
+
+        assert all(end - beg == 1 or breaker.line_width(beg, end) <= width for beg, end in lines)
+        assert raggedness(breaker, lines) == naive_balanced(breaker)
+
+
+def test_greedy_is_lazy():
+    breaker = LineBreaker([10] * 1_000_000, 1, 50)
+    assert next(breaker.greedy()) == (0, 4)
+
+
+def test_wide_words_get_their_own_line():
+    breaker = LineBreaker([5, 100, 5], 1, 20)
+    assert list(breaker.greedy()) == list(breaker.balanced()) == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_paragraph_lines_are_a_flat_list():
+    font = Font.get('Arial', '400')
+    p = Paragraph(Text(font, 'one two three four five six\n\tseven eight', size=10), 60, 100)
+
+    # one string per line, the lines of all text lines one after the other, tabs indented by spaces
+    assert p.lines == ['one two', 'three four', 'five six', '    seven', 'eight']
+    assert all(font.measure(line, 10) <= 60 for line in p.lines)
@@ -0,0 +1,140 @@
+import re
+import xml.etree.ElementTree as ET
+
+from PSVG import Document, Section, G, Circle, Rect, Table, TextBox, Text, Font
+
+_MATRIX = re.compile(r'matrix\(([^)]*)\)')
+
+
+def drawn(svg: str) -> list:
+    """
+    Drawn elements of an svg definition in document order, with their coordinates made absolute,
+    together with the nested svgs (viewports) they are drawn in
+    """
+    found = []
+
+    def number(value):
+        try:
+            return round(float(value), 6)
+        except (TypeError, ValueError):
+            return value
+
+    def walk(element, dx, dy, viewports):
+        tag = element.tag.split('}')[-1]
+        attrs = dict(element.attrib)
+        if tag == 'g' and 'transform' in attrs:
+            a, b, c, d, e, f = map(float, _MATRIX.match(attrs.pop('transform')).group(1).split(','))
+            assert (a, b, c, d) == (1, 0, 0, 1), 'only translations are compared'
+            dx, dy = dx + e, dy + f
+        elif tag == 'svg':
+            dx, dy = dx + float(attrs.pop('x', 0)), dy + float(attrs.pop('y', 0))
+            viewports = viewports + ((number(dx), number(dy), attrs['width'], attrs['height']),)
+
+        if len(element) == 0 and tag not in ('g', 'svg', 'defs'):
+            for name, offset in (('x', dx), ('y', dy), ('cx', dx), ('cy', dy)):
+                if name in attrs and not attrs[name].endswith('%'):
+                    attrs[name] = float(attrs[name]) + offset
+
+            found.append((tag, {k: number(v) for k, v in attrs.items()}, element.text, viewports))
+
+        for child in element:
+            walk(child, dx, dy, viewports)
+
+    walk(ET.fromstring(svg), 0.0, 0.0, ())
+    return found
+
+
+def size(node) -> int:
+    return 1 + sum(size(child) for child in node.edges)
+
+
+def section_document():
+    d = Document(w=200, h=200)
+    s = Section(10, 20, 100, 100)
+    s.addChild(Circle(1, 2, 3))
+    s.addChild(Rect(4, 5, 6, 7, active=False))
+    inner = G(x=3, y=4)
+    inner.add_child(Rect(1, 1, 2, 2))
+    inner.add_child(G(x=1))
+    s.addChild(inner)
+    d.addSection(s)
+    return d
+
+
+def table_document():
+    d = Document(w=400, h=200)
+    t = Table(Text(Font.get('Arial', '400'), ''), [['a', 'b'], ['c', 'd']])
+    t.even_col_width(300)
+    t.even_row_height(100)
+    t.set_row_color(0, (1, 2, 3), 1)
+    t.set()
+    t.x, t.y = 5, 6
+    d.addSection(t)
+    return d
+
+
+def textbox_document():
+    d = Document(w=400, h=200)
+    box = TextBox(Text(Font.get('Arial', '400'), 'hello'), alignment=(0, 1))
+    box.xywh = (7, 8, 100, 50)
+    box.set()
+    d.addSection(box)
+    return d
+
+
+def test_optimized_documents_draw_the_same():
+    for build in (section_document, table_document, textbox_document):
+        d = build()
+        before, nodes = drawn(d.construct()), size(d.root)
+
+        removed = d.optimize()
+        assert drawn(d.construct()) == before
+        assert removed == nodes - size(d.root) > 0
+
+
+def test_removed_count():
+    d = Document(w=10, h=10)
+    g = G()
+    g.add_child(Circle(1, 1, 1))
+    g.add_child(Rect(active=False))
+    g.add_child(G(x=2))
+    d.addChild(g)
+
+    # the inactive rect, the empty group and the group without transformation
+    assert d.optimize() == 3
+    assert [type(node) for node in d.root.edges] == [Circle]
+
+
+def test_groups_with_relative_coordinates_are_kept():
+    d = Document(w=10, h=10)
+    g = G(x=5, y=5)
+    rect = Rect(x='50%', y=1, w=1, h=1)
+    g.add_child(rect)
+    d.addChild(g)
+
+    assert d.optimize() == 0
+    assert list(d.root.edges) == [g] and rect.x == '50%' and rect.y == 1
+
+
+def test_nodes_with_several_parents_are_not_moved():
+    d = Document(w=10, h=10)
+    circle = Circle(1, 1, 1)
+    groups = [G(x=2), G(x=3)]
+    for g in groups:
+        g.add_child(circle)
+        d.addChild(g)
+
+    before = drawn(d.construct())
+    assert d.optimize() == 0
+    assert list(d.root.edges) == groups and (circle.cx, circle.cy) == (1, 1)
+    assert drawn(d.construct()) == before
+
+
+def test_optimizing_a_shared_copy_leaves_the_template_alone():
+    d = section_document()
+    before = d.construct()
+
+    c = d.share()
+    assert c.optimize() > 0
+    assert d.construct() == before
+    assert drawn(c.construct()) == drawn(before)
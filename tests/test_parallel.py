@@ -0,0 +1,35 @@
+import multiprocessing
+
+import pytest
+
+from PSVG import Document, Section, Circle, Font, Text, render_many
+
+METHODS = [m for m in ('fork', 'spawn') if m in multiprocessing.get_all_start_methods()]
+
+
+def build(n=0):
+    d = Document(w=100, h=100)
+    for i in range(4):
+        s = Section(i, n, 50, 50)
+        for j in range(50):
+            s.addChild(Circle(j * 0.5, j * 1.5, 1.25, fill=(j % 3, 2, 3)))
+        s.addChild(Text(Font.get('Arial', '400'), f'section {i}'))
+        d.addSection(s)
+
+    d.addChild(Circle(1, 2, 3))
+    return d
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_parallel_construct_matches_serial(method):
+    context = multiprocessing.get_context(method)
+    for options in ({}, {'classes': True, 'minify': True, 'precision': 1}):
+        assert build().construct(parallel=2, mp_context=context, **options) == build().construct(**options)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_render_many_matches_serial(method):
+    documents = [build(n) for n in range(3)]
+    rendered = render_many(documents, workers=2, mp_context=multiprocessing.get_context(method), precision=2)
+
+    assert rendered == [d.construct(precision=2) for d in documents]
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from PSVG import Path
+from PSVG.Render import RenderOptions
+
+
+def test_elide_keeps_repeated_moves():
+    path = Path(commands='MMLL', coords=[0, 0, 5, 5, 10, 10, 20, 20])
+    assert path._render().endswith('d="M0 0M5 5 10 10 20 20"/>')
+
+
+def test_elide_repeated_commands():
+    path = Path(commands='MLLCC', coords=[0, 0, 1, 1, 2, 2] + list(range(12)))
+    assert 'd="M0 0 1 1 2 2C0 1 2 3 4 5 6 7 8 9 10 11"' in path._render()
+
+
+def test_decimate_rejects_non_positive_width():
+    path = Path.polyline(np.arange(10), np.arange(10))
+    for width in (0, -1, float('nan')):
+        with pytest.raises(ValueError):
+            path.decimate(width)
+
+
+def test_relative_rounding_does_not_accumulate():
+    x = np.arange(10) * 0.4
+    path = Path.polyline(x, x, relative=True)
+    d = path._render(RenderOptions(precision=0)).split('d="')[1].split('"')[0]
+
+    # summing the relative steps gives back the rounded absolute points
+    steps = np.array(d[1:].split(), dtype=float).reshape(-1, 2)
+    assert np.array_equal(np.cumsum(steps, axis=0)[:, 0], x.round(0))
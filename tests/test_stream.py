@@ -0,0 +1,46 @@
+import asyncio
+import io
+
+import numpy as np
+
+from PSVG import Document, Section, Circle
+from PSVG.Draw.Batch import CircleBatch
+
+
+def build():
+    d = Document(w=100, h=100)
+    s = Section(0, 0, 100, 100)
+    for i in range(2000):
+        s.addChild(Circle(i, i, 1))
+    d.addSection(s)
+
+    n = 20000
+    d.addChild(CircleBatch(cx=np.arange(n) * 0.5, cy=np.arange(n) * 1.5, r=np.full(n, 1.0)))
+    return d
+
+
+async def collect(document, **options):
+    return [chunk async for chunk in document.aiter_construct(**options)]
+
+
+def test_aiter_construct_chunks_large_branches():
+    document = build()
+    chunks = asyncio.run(collect(document, chunk_size=4096))
+
+    assert ''.join(chunks) == document.construct()
+
+    # every branch is streamed in pieces, a single batch fragment (4096 elements) is the largest unit
+    assert len(chunks) > 20
+    assert max(map(len, chunks)) < 4096 * 64
+
+
+def test_streaming_stores_no_output():
+    document = build()
+    asyncio.run(collect(document, cache=True))
+    document.write(io.StringIO(), cache=True)
+
+    stack = [document.root]
+    while stack:
+        node = stack.pop()
+        assert node._cache is None
+        stack.extend(node._edges)
@@ -0,0 +1,59 @@
+from PSVG import Document, Font, Table, Text
+
+
+def build():
+    table = Table(Text(Font.get('Arial', '400'), ''), [['a', 'b', 'c'], ['d', 'e', 'f']])
+    table.even_col_width(200)
+    table.even_row_height(60)
+    for i in table.r_rng:
+        table.set_row_color(i, (i, 2, 3), 1)
+    for j in table.c_rng:
+        table.set_col_color(j, (1, j, 3), 1)
+
+    return table
+
+
+def render(table):
+    d = Document(w=500, h=500)
+    d.addSection(table)
+    return d.construct()
+
+
+def test_incremental_layout_matches_fresh_layout():
+    changes = [
+        lambda t: t.weighted_col_width(300, [0.5, 0.25, 0.25]),
+        lambda t: t.even_row_height(150),
+        lambda t: t.set_row(1, 20),
+        lambda t: t.set_col(0, 40),
+        lambda t: t.auto_col_width(padding=2),
+    ]
+
+    incremental = build()
+    incremental.set()
+    for i, change in enumerate(changes):
+        change(incremental)
+        incremental.set()
+
+        fresh = build()
+        for c in changes[:i + 1]:
+            c(fresh)
+        fresh.set()
+
+        assert render(incremental) == render(fresh)
+
+
+def test_incremental_layout_applies_alignment_and_margin():
+    table = build()
+    table.set()
+
+    box = table.boxes[0, 0]
+    box.alignment = box.left
+    table.boxes[1, 2].margin = 0.25
+    table.set()
+    assert box.text.anchor == 'start'
+
+    fresh = build()
+    fresh.boxes[0, 0].alignment = fresh.boxes[0, 0].left
+    fresh.boxes[1, 2].margin = 0.25
+    fresh.set()
+    assert render(table) == render(fresh)
@@ -0,0 +1,81 @@
+import io
+
+import pytest
+
+from PSVG import Document, G, Rect, Template, Text, Font
+
+
+def build():
+    d = Document(w=100, h=100)
+    g = G(x=5)
+    d.addChild(g)
+
+    rect = Rect(0, 0, 10, 20, fill=(1, 2, 3), fill_opacity=0.5)
+    label = Text(Font.get('Arial', '400'), 'default', x=1, y=2)
+    g.add_child(rect)
+    g.add_child(label)
+    return d, g, rect, label
+
+
+def test_defaults_reproduce_the_tree():
+    d, _, rect, label = build()
+    template = Template(d, {'w': (rect, 'w'), 'label': [(label, 'text')]})
+
+    assert template.render() == d.construct()
+    assert template.defaults == {'w': 10, 'label': 'default'}
+
+
+def test_values_are_formatted_like_the_tree():
+    d, _, rect, label = build()
+    slots = {'w': [(rect, 'w'), (label, 'x')], 'fill': (rect, 'fill'), 'opacity': (rect, 'fill_opacity'),
+             'dashes': (rect, 'stroke_dasharray'), 'stroke': (rect, 'stroke')}
+    template = Template(d, slots, precision=1)
+
+    out = template.render(w=12.345, fill=(255, 0, 16), opacity=1.5, dashes=[1, 2.25], stroke=(0, 0, 0))
+
+    rect.w = label.x = 12.345
+    rect.fill, rect.fill_opacity, rect.stroke_dasharray, rect.stroke = (255, 0, 16), 1.5, [1, 2.25], (0, 0, 0)
+    assert out == d.construct(precision=1)
+    assert 'fill="#ff0010"' in out and 'fill-opacity="1"' in out and 'stroke-dasharray="1 2.2"' in out
+
+
+def test_write():
+    d, _, rect, _ = build()
+    fp = io.BytesIO()
+    Template(d, {'w': (rect, 'w')}).write(fp, encoding='utf-8', w=7)
+    assert b'width="7"' in fp.getvalue()
+
+
+def test_unknown_slot():
+    d, _, rect, _ = build()
+    with pytest.raises(ValueError, match='unknown slot'):
+        Template(d, {'w': (rect, 'w')}).render(h=3)
+
+
+def test_missing_value():
+    d, _, rect, _ = build()
+    template = Template(d, {'stroke': (rect, 'stroke')})
+
+    with pytest.raises(ValueError, match='stroke'):
+        template.render()
+
+    assert 'stroke="#000000"' in template.render(stroke=(0, 0, 0))
+
+
+def test_inactive_node():
+    d, _, rect, _ = build()
+    rect.active = False
+
+    with pytest.raises(ValueError, match='not part of the svg definition'):
+        Template(d, {'w': (rect, 'w')})
+
+
+def test_calculated_attribute_is_rejected():
+    d, g, _, label = build()
+
+    for binding in [(g, 'x'), (label, 'font'), (g, 'missing')]:
+        with pytest.raises(ValueError, match='can not be bound|has no attribute'):
+            Template(d, {'slot': binding})
+
+    # the tree is left as it was
+    assert g.x == 5 and 'matrix(1.0,0.0,-0.0,1.0,5.0,0.0)' in d.construct()
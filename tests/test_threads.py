@@ -0,0 +1,68 @@
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from PSVG import Document, Section, Circle, Rect, Text, Paragraph, TextBox, Use, Font
+
+OPTIONS = [{}, {'minify': True}, {'precision': 1}, {'classes': True}, {'classes': True, 'minify': True, 'precision': 2}]
+
+
+@pytest.fixture
+def switch_often():
+    # switching threads as often as possible makes races show up within a few hundred renders
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def build(font, shared):
+    d = Document(w=500, h=500)
+    for i in range(10):
+        s = Section(i, 0, 100, 100)
+        for j in range(50):
+            s.addChild(Circle(j * 0.5, j * 1.5, 1.25, fill=(j % 3, 2, 3)))
+        s.addChild(Text(font, 'hi\tthere', x=1, y=2))
+
+        # the same leaf is a child of every section
+        s.addChild(shared)
+        d.addSection(s)
+
+    d.addSection(Paragraph(Text(font, 'lorem ipsum\tdolor sit amet ' * 20), 200, 100))
+    d.define(TextBox(Text(font, 'box')), 'box')
+    d.addChild(Use('box', 3, 4))
+    return d
+
+
+def render(document, options, streamed):
+    if not streamed:
+        return document.construct(**options)
+
+    newline = '' if options.get('minify') else '\n'
+    return newline.join(document.iter_construct(**options))
+
+
+def test_concurrent_renders_of_shared_tree_and_font(switch_often):
+    font = Font.get('Arial', '400')
+    expected = [build(font, Rect(1, 2, 3, 4)).construct(**options) for options in OPTIONS]
+    widths = dict(font)
+
+    document = build(font, Rect(1, 2, 3, 4))
+
+    def job(i):
+        k = random.randrange(len(OPTIONS))
+        return render(document, dict(OPTIONS[k], cache=False), i % 2) == expected[k]
+
+    with ThreadPoolExecutor(16) as executor:
+        assert all(executor.map(job, range(200)))
+
+    # rendering without cache left no trace on the tree or on the font
+    stack = [document.root]
+    while stack:
+        node = stack.pop()
+        assert node._cache is None
+        stack.extend(node._edges)
+
+    assert dict(font) == widths